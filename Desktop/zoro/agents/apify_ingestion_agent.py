@@ -8,13 +8,32 @@ Gets REAL TikTok data with actual follower counts and verified accounts.
 """
 
 import asyncio
+import functools
 import json
+import os
+import sqlite3
 import time
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from types import MappingProxyType
 
-from apify_client import ApifyClient
+from apify_client import ApifyClientAsync
+
+# orjson is optional; it serializes cached scrape results much faster than the stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Top-rated Apify TikTok actors
+_TIKTOK_ACTORS = MappingProxyType({
+    "profile_scraper": "clockworks/tiktok-profile-scraper",  # 9.7K users, 4.8★
+    "hashtag_scraper": "clockworks/tiktok-hashtag-scraper",  # 5.2K users, 4.6★
+    "data_extractor": "clockworks/free-tiktok-scraper",      # 29K users, 4.8★
+    "video_scraper": "clockworks/tiktok-video-scraper",      # 3.5K users, 4.8★
+})
 
 @dataclass
 class TikTokCreatorData:
@@ -46,22 +65,100 @@ class TikTokVideoData:
     music_title: str
     duration: int
 
+def _safe_int(value, default=0):
+    """Safely convert to int"""
+    try:
+        return int(value) if value is not None else default
+    except (ValueError, TypeError):
+        return default
+
+def _safe_bool(value, default=False):
+    """Safely convert to bool"""
+    try:
+        if isinstance(value, bool):
+            return value
+        return bool(value) if value is not None else default
+    except (ValueError, TypeError):
+        return default
+
+def _safe_timestamp(value):
+    """Safely convert an ISO string or Unix timestamp to datetime"""
+    try:
+        if value:
+            # Handle ISO timestamp strings (createTimeISO)
+            if isinstance(value, str) and 'T' in value:
+                return datetime.fromisoformat(value.replace('Z', '+00:00'))
+            # Handle Unix timestamps (createTime)
+            elif isinstance(value, (int, float)) or (isinstance(value, str) and value.isdigit()):
+                return datetime.fromtimestamp(int(value))
+            else:
+                return datetime.now()
+        else:
+            return datetime.now()
+    except (ValueError, TypeError):
+        return datetime.now()
+
+@functools.lru_cache(maxsize=None)
+def shared_async_client(api_token: str) -> ApifyClientAsync:
+    """One async Apify client per token so every ingestion instance shares its connection pool"""
+    return ApifyClientAsync(api_token)
+
+class ApifyCache:
+    """SQLite cache of scraped videos (as JSON) so repeated hashtag scrapes within the TTL skip Apify"""
+    
+    def __init__(self, path: str = "apify_cache.db", ttl_seconds: int = 3600):
+        self.ttl_seconds = ttl_seconds
+        self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS apify_cache (key TEXT PRIMARY KEY, ts INTEGER, payload BLOB)"
+        )
+    
+    def get(self, key: str) -> Optional[List["TikTokVideoData"]]:
+        """Return the cached videos for key, or None if missing, expired or unreadable"""
+        row = self.conn.execute(
+            "SELECT payload FROM apify_cache WHERE key = ? AND ts > ?",
+            (key, int(time.time()) - self.ttl_seconds)
+        ).fetchone()
+        if not row:
+            return None
+        try:
+            records = orjson.loads(row[0]) if ORJSON_AVAILABLE else json.loads(row[0])
+            videos = []
+            for record in records:
+                record['created_at'] = datetime.fromisoformat(record['created_at'])
+                videos.append(TikTokVideoData(**record))
+            return videos
+        except (ValueError, TypeError, KeyError):
+            # Rows written by an older TikTokVideoData shape are treated as a miss
+            return None
+    
+    def set(self, key: str, videos: List["TikTokVideoData"]):
+        """Store videos under key with the current timestamp"""
+        records = [asdict(video) for video in videos]
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(records).decode()
+        else:
+            payload = json.dumps(records, default=datetime.isoformat)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO apify_cache (key, ts, payload) VALUES (?, ?, ?)",
+            (key, int(time.time()), payload)
+        )
+
 class ApifyTikTokIngestion:
     """
     High-quality TikTok data ingestion using Apify actors
     """
     
     def __init__(self, api_token: str):
-        self.client = ApifyClient(api_token)
+        self.client = shared_async_client(api_token)
         self.api_token = api_token
         
-        # Top-rated Apify TikTok actors
-        self.actors = {
-            "profile_scraper": "clockworks/tiktok-profile-scraper",  # 9.7K users, 4.8★
-            "hashtag_scraper": "clockworks/tiktok-hashtag-scraper",  # 5.2K users, 4.6★
-            "data_extractor": "clockworks/free-tiktok-scraper",      # 29K users, 4.8★
-            "video_scraper": "clockworks/tiktok-video-scraper",      # 3.5K users, 4.8★
-        }
+        self.actors = _TIKTOK_ACTORS
+        
+        # Local result cache; APIFY_CACHE_TTL=0 disables it
+        cache_ttl = int(os.getenv("APIFY_CACHE_TTL", 3600))
+        self.cache = ApifyCache(ttl_seconds=cache_ttl) if cache_ttl > 0 else None
+        self._inflight = {}
     
     async def get_creator_profile(self, username: str) -> Optional[TikTokCreatorData]:
         """
@@ -76,47 +173,30 @@ class ApifyTikTokIngestion:
                 "resultsType": "details"
             }
             
-            # Run the actor
-            run = self.client.actor(self.actors["profile_scraper"]).call(
+            # Run the actor without blocking the event loop
+            run = await self.client.actor(self.actors["profile_scraper"]).call(
                 run_input=run_input,
                 timeout_secs=300
             )
             
-            # Get the results
-            results = []
-            for item in self.client.dataset(run["defaultDatasetId"]).iterate_items():
-                results.append(item)
+            # Only the first dataset item is used, so stop paging after it
+            profile = None
+            async for item in self.client.dataset(run["defaultDatasetId"]).iterate_items(limit=1):
+                profile = item
             
-            if results:
-                profile = results[0]
-                
-                # Helper function to safely convert to int
-                def safe_int(value, default=0):
-                    try:
-                        return int(value) if value is not None else default
-                    except (ValueError, TypeError):
-                        return default
-                
-                # Helper function to safely convert to bool
-                def safe_bool(value, default=False):
-                    try:
-                        if isinstance(value, bool):
-                            return value
-                        return bool(value) if value is not None else default
-                    except (ValueError, TypeError):
-                        return default
-                
+            if profile:
+                get = profile.get
                 creator_data = TikTokCreatorData(
-                    username=str(profile.get("uniqueId", username)),
-                    display_name=str(profile.get("nickname", "")),
-                    followers=safe_int(profile.get("followerCount")),
-                    following=safe_int(profile.get("followingCount")), 
-                    likes=safe_int(profile.get("heartCount")),
-                    videos=safe_int(profile.get("videoCount")),
-                    verified=safe_bool(profile.get("verified")),
-                    bio=str(profile.get("signature", "")),
-                    avatar_url=str(profile.get("avatarLarger", "")),
-                    is_private=safe_bool(profile.get("privateAccount"))
+                    username=str(get("uniqueId", username)),
+                    display_name=str(get("nickname", "")),
+                    followers=_safe_int(get("followerCount")),
+                    following=_safe_int(get("followingCount")), 
+                    likes=_safe_int(get("heartCount")),
+                    videos=_safe_int(get("videoCount")),
+                    verified=_safe_bool(get("verified")),
+                    bio=str(get("signature", "")),
+                    avatar_url=str(get("avatarLarger", "")),
+                    is_private=_safe_bool(get("privateAccount"))
                 )
                 
                 print(f"✅ SUCCESS: Got REAL data for @{username}!")
@@ -134,10 +214,29 @@ class ApifyTikTokIngestion:
             return None
     
     async def get_hashtag_videos(self, hashtag: str, max_videos: int = 20) -> List[TikTokVideoData]:
+        """
+        Get real videos for a hashtag; identical concurrent requests share one scrape
+        """
+        key = (hashtag.lower(), max_videos)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._get_hashtag_videos(hashtag, max_videos))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return list(await asyncio.shield(task))
+    
+    async def _get_hashtag_videos(self, hashtag: str, max_videos: int) -> List[TikTokVideoData]:
         """
         Get real videos for a hashtag using the main TikTok Scraper
         """
         try:
+            cache_key = f"hashtag:{hashtag.lower()}:{max_videos}"
+            if self.cache:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    print(f"⚡ Using cached videos for #{hashtag} ({len(cached)} videos)")
+                    return cached
+            
             print(f"🏷️ Fetching videos for #{hashtag}...")
             
             # Use the hashtag scraper
@@ -149,65 +248,41 @@ class ApifyTikTokIngestion:
                 "sort": "recent"  # 🔥 FIX: Get recent videos, not old viral content
             }
             
-            # Run the actor
-            run = self.client.actor(self.actors["hashtag_scraper"]).call(
+            # Run the actor without blocking the event loop
+            run = await self.client.actor(self.actors["hashtag_scraper"]).call(
                 run_input=run_input,
                 timeout_secs=300
             )
             
             # Get the results
             videos = []
-            for item in self.client.dataset(run["defaultDatasetId"]).iterate_items():
+            async for item in self.client.dataset(run["defaultDatasetId"]).iterate_items():
                 
-                # Extract hashtags from description
-                desc = item.get("text", "")
-                hashtags = []
-                words = desc.split()
-                for word in words:
-                    if word.startswith("#"):
-                        hashtags.append(word[1:])  # Remove #
-                
-                # Helper function to safely convert to int
-                def safe_int(value, default=0):
-                    try:
-                        return int(value) if value is not None else default
-                    except (ValueError, TypeError):
-                        return default
+                get = item.get
                 
-                # Helper function to safely convert timestamp
-                def safe_timestamp(value):
-                    try:
-                        if value:
-                            # Handle ISO timestamp strings (createTimeISO)
-                            if isinstance(value, str) and 'T' in value:
-                                return datetime.fromisoformat(value.replace('Z', '+00:00'))
-                            # Handle Unix timestamps (createTime)
-                            elif isinstance(value, (int, float)) or (isinstance(value, str) and value.isdigit()):
-                                return datetime.fromtimestamp(int(value))
-                            else:
-                                return datetime.now()
-                        else:
-                            return datetime.now()
-                    except (ValueError, TypeError):
-                        return datetime.now()
+                # Extract hashtags from description
+                desc = get("text", "")
+                hashtags = [word[1:] for word in desc.split() if word.startswith("#")]
                 
                 video_data = TikTokVideoData(
-                    video_id=str(item.get("id", "")),
-                    creator_username=str(item.get("authorMeta", {}).get("name", "")),
+                    video_id=str(get("id", "")),
+                    creator_username=str(get("authorMeta", {}).get("name", "")),
                     description=desc,
-                    views=safe_int(item.get("playCount")),
-                    likes=safe_int(item.get("diggCount")),
-                    comments=safe_int(item.get("commentCount")),
-                    shares=safe_int(item.get("shareCount")),
-                    created_at=safe_timestamp(item.get("createTimeISO")),
-                    video_url=str(item.get("webVideoUrl", "")),
+                    views=_safe_int(get("playCount")),
+                    likes=_safe_int(get("diggCount")),
+                    comments=_safe_int(get("commentCount")),
+                    shares=_safe_int(get("shareCount")),
+                    created_at=_safe_timestamp(get("createTimeISO")),
+                    video_url=str(get("webVideoUrl", "")),
                     hashtags=hashtags,
-                    music_title=str(item.get("musicMeta", {}).get("musicName", "")),
-                    duration=safe_int(item.get("videoMeta", {}).get("duration"))
+                    music_title=str(get("musicMeta", {}).get("musicName", "")),
+                    duration=_safe_int(get("videoMeta", {}).get("duration"))
                 )
                 videos.append(video_data)
             
             print(f"✅ Found {len(videos)} REAL videos for #{hashtag}")
+            if self.cache and videos:
+                self.cache.set(cache_key, videos)
             return videos
             
         except Exception as e:
@@ -261,11 +336,23 @@ async def test_apify_with_mrbeast():
     # Initialize Apify ingestion
     apify_client = ApifyTikTokIngestion(api_token)
     
+    test_hashtags = ["mrbeast", "viral", "money"]
+    
+    # Profile and hashtag scrapes are independent, so run them all at once;
+    # a failure in one must not cancel the others
+    mrbeast_data, *hashtag_results = await asyncio.gather(
+        apify_client.get_creator_profile("mrbeast"),
+        *(apify_client.get_hashtag_videos(hashtag, max_videos=5) for hashtag in test_hashtags),
+        return_exceptions=True
+    )
+    
     # Test 1: Get MrBeast's real profile
     print("📊 TEST 1: MRBEAST PROFILE DATA")
     print("-" * 35)
     
-    mrbeast_data = await apify_client.get_creator_profile("mrbeast")
+    if isinstance(mrbeast_data, Exception):
+        print(f"❌ Profile scrape failed: {mrbeast_data}")
+        mrbeast_data = None
     
     if mrbeast_data:
         print(f"🎯 REAL MRBEAST DATA:")
@@ -289,12 +376,10 @@ async def test_apify_with_mrbeast():
     print(f"\n📊 TEST 2: TRENDING HASHTAG VIDEOS")
     print("-" * 38)
     
-    test_hashtags = ["mrbeast", "viral", "money"]
-    
-    for hashtag in test_hashtags:
-        videos = await apify_client.get_hashtag_videos(hashtag, max_videos=5)
-        
-        if videos:
+    for hashtag, videos in zip(test_hashtags, hashtag_results):
+        if isinstance(videos, Exception):
+            print(f"❌ Scrape failed for #{hashtag}: {videos}")
+        elif videos:
             print(f"\n🏷️ #{hashtag} TOP VIDEOS:")
             for i, video in enumerate(videos[:3], 1):
                 print(f"   {i}. @{video.creator_username}")
@@ -11,7 +11,11 @@ from typing import Dict, Any, List, Optional, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 import asyncio
+import heapq
+import importlib
+import itertools
 import logging
+import time
 import structlog
 from enum import Enum
 
@@ -26,12 +30,15 @@ from pydantic import BaseModel, Field
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.definitions import AgentRole, SYSTEM_CADENCE
+from config.definitions import AgentRole, SYSTEM_CADENCE, DATACLASS_SLOTS
 
 # =============================================================================
 # AGENT STATUS & HEALTH
 # =============================================================================
 
+# Health snapshots are reused for this long unless the agent changes state
+HEALTH_CACHE_TTL_SECONDS = 1.0
+
 class AgentStatus(Enum):
     """Agent operational status"""
     IDLE = "idle"
@@ -40,16 +47,17 @@ class AgentStatus(Enum):
     MAINTENANCE = "maintenance"
     STOPPED = "stopped"
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AgentHealth:
     """Health metrics for an agent"""
     status: AgentStatus = AgentStatus.IDLE
-    last_execution: Optional[datetime] = None
+    last_execution: Optional[float] = None  # epoch seconds
+    last_execution_iso: Optional[str] = None  # formatted once when last_execution is set
     execution_count: int = 0
     error_count: int = 0
     average_execution_time: float = 0.0
     last_error: Optional[str] = None
-    uptime_start: datetime = field(default_factory=datetime.now)
+    uptime_start: float = field(default_factory=time.time)  # epoch seconds
     
     @property
     def success_rate(self) -> float:
@@ -111,6 +119,7 @@ class BaseAgent(ABC):
     ):
         self.agent_name = agent_name
         self.agent_role = agent_role
+        self.role_value = agent_role.value  # the role never changes; resolve the enum value once
         self.config = config or {}
         self.health = AgentHealth()
         self.tools = tools or []
@@ -119,7 +128,7 @@ class BaseAgent(ABC):
         # Set up structured logging
         self.logger = structlog.get_logger().bind(
             agent_name=agent_name,
-            agent_role=agent_role.value
+            agent_role=self.role_value
         )
         
         # LangChain components
@@ -127,9 +136,12 @@ class BaseAgent(ABC):
         self.agent_executor: Optional[AgentExecutor] = None
         
         # Task queue and execution state
-        self.task_queue: List[AgentTask] = []
+        # Min-heap of (priority, sequence, task); the sequence keeps FIFO order within a priority
+        self.task_queue: List[tuple] = []
+        self._task_sequence = itertools.count()
         self.current_task: Optional[AgentTask] = None
         self.is_running = False
+        self._health_cache: Optional[tuple] = None  # (monotonic time, status dict)
         
         # Initialize the agent
         self._initialize_agent()
@@ -168,31 +180,34 @@ class BaseAgent(ABC):
     
     def add_task(self, task: AgentTask) -> bool:
         """Add a task to the agent's queue"""
+        # Check if we should execute immediately or queue; only the datetime comparison can fail
         try:
-            # Check if we should execute immediately or queue
-            if task.scheduled_for is None or task.scheduled_for <= datetime.now():
-                self.task_queue.append(task)
-                self.task_queue.sort(key=lambda t: t.priority)  # Sort by priority
-                self.logger.info("Task added to queue", task_id=task.task_id, task_type=task.task_type)
-                return True
-            else:
-                # Schedule for later (would integrate with scheduler in production)
-                self.logger.info("Task scheduled for later", task_id=task.task_id, scheduled_for=task.scheduled_for)
-                return True
-        except Exception as e:
+            run_now = task.scheduled_for is None or task.scheduled_for <= datetime.now()
+        except TypeError as e:  # timezone-aware scheduled_for
             self.logger.error("Failed to add task", task_id=task.task_id, error=str(e))
             return False
+        
+        if not run_now:
+            # Schedule for later (would integrate with scheduler in production)
+            self.logger.info("Task scheduled for later", task_id=task.task_id, scheduled_for=task.scheduled_for)
+            return True
+        
+        heapq.heappush(self.task_queue, (task.priority, next(self._task_sequence), task))
+        self._health_cache = None
+        self.logger.info("Task added to queue", task_id=task.task_id, task_type=task.task_type)
+        return True
     
     async def process_next_task(self) -> Optional[AgentResult]:
         """Process the next task in the queue"""
         if not self.task_queue or self.health.status != AgentStatus.IDLE:
             return None
         
-        task = self.task_queue.pop(0)
+        task = heapq.heappop(self.task_queue)[2]
         self.current_task = task
         self.health.status = AgentStatus.RUNNING
+        self._health_cache = None
         
-        start_time = datetime.now()
+        start_time = time.perf_counter()  # monotonic, immune to wall-clock adjustments
         
         try:
             self.logger.info("Starting task execution", task_id=task.task_id, task_type=task.task_type)
@@ -204,8 +219,9 @@ class BaseAgent(ABC):
             )
             
             # Update health metrics
-            execution_time = (datetime.now() - start_time).total_seconds()
-            self.health.last_execution = datetime.now()
+            execution_time = time.perf_counter() - start_time
+            self.health.last_execution = time.time()
+            self.health.last_execution_iso = datetime.fromtimestamp(self.health.last_execution).isoformat()
             self.health.execution_count += 1
             self._update_average_execution_time(execution_time)
             
@@ -232,7 +248,7 @@ class BaseAgent(ABC):
                 agent_name=self.agent_name,
                 success=False,
                 error_message=self.health.last_error,
-                execution_time_seconds=(datetime.now() - start_time).total_seconds()
+                execution_time_seconds=time.perf_counter() - start_time
             )
             
         except Exception as e:
@@ -245,12 +261,13 @@ class BaseAgent(ABC):
                 agent_name=self.agent_name,
                 success=False,
                 error_message=str(e),
-                execution_time_seconds=(datetime.now() - start_time).total_seconds()
+                execution_time_seconds=time.perf_counter() - start_time
             )
             
         finally:
             self.current_task = None
             self.health.status = AgentStatus.IDLE
+            self._health_cache = None
     
     # =============================================================================
     # HEALTH & MONITORING
@@ -258,19 +275,25 @@ class BaseAgent(ABC):
     
     def get_health_status(self) -> Dict[str, Any]:
         """Get current health status of the agent"""
-        return {
+        now = time.monotonic()
+        if self._health_cache and now - self._health_cache[0] < HEALTH_CACHE_TTL_SECONDS:
+            return dict(self._health_cache[1])
+        
+        status = {
             "agent_name": self.agent_name,
-            "agent_role": self.agent_role.value,
+            "agent_role": self.role_value,
             "status": self.health.status.value,
-            "uptime_seconds": (datetime.now() - self.health.uptime_start).total_seconds(),
+            "uptime_seconds": time.time() - self.health.uptime_start,
             "execution_count": self.health.execution_count,
             "error_count": self.health.error_count,
             "success_rate": self.health.success_rate,
             "average_execution_time": self.health.average_execution_time,
             "queue_length": len(self.task_queue),
-            "last_execution": self.health.last_execution.isoformat() if self.health.last_execution else None,
+            "last_execution": self.health.last_execution_iso,
             "last_error": self.health.last_error
         }
+        self._health_cache = (now, status)
+        return dict(status)
     
     def _update_average_execution_time(self, execution_time: float):
         """Update rolling average execution time"""
@@ -315,18 +338,21 @@ class BaseAgent(ABC):
         """Start the agent"""
         self.is_running = True
         self.health.status = AgentStatus.IDLE
+        self._health_cache = None
         self.logger.info("Agent started")
     
     def stop(self):
         """Stop the agent"""
         self.is_running = False
         self.health.status = AgentStatus.STOPPED
+        self._health_cache = None
         self.logger.info("Agent stopped")
     
     def clear_queue(self):
         """Clear the task queue"""
         cleared_count = len(self.task_queue)
         self.task_queue.clear()
+        self._health_cache = None
         self.logger.info("Task queue cleared", cleared_tasks=cleared_count)
     
     def get_queue_info(self) -> Dict[str, Any]:
@@ -339,13 +365,13 @@ class BaseAgent(ABC):
             } if self.current_task else None,
             "next_tasks": [
                 {"task_id": task.task_id, "task_type": task.task_type, "priority": task.priority}
-                for task in self.task_queue[:5]  # Show next 5 tasks
+                for _, _, task in heapq.nsmallest(5, self.task_queue)  # Show next 5 tasks
             ]
         }
     
     def __repr__(self) -> str:
         return (f"BaseAgent(name={self.agent_name}, "
-                f"role={self.agent_role.value}, "
+                f"role={self.role_value}, "
                 f"status={self.health.status.value}, "
                 f"queue_length={len(self.task_queue)})")
 
@@ -375,25 +401,28 @@ class SemanticTask(AgentTask):
 class AgentFactory:
     """Factory for creating different types of agents"""
     
-    @staticmethod
-    def create_agent(agent_role: AgentRole, config: Dict[str, Any] = None) -> BaseAgent:
+    # Role -> (module, class); modules are only imported for the role requested
+    AGENT_CLASSES: Dict[AgentRole, tuple] = {
+        AgentRole.INGESTION: ("agents.ingestion_agent", "IngestionAgent"),
+        AgentRole.ANALYZER: ("agents.analyzer_agent", "AnalyzerAgent"),
+        AgentRole.SEMANTIC: ("agents.semantic_agent", "SemanticAgent"),
+        # Add more agents as implemented
+    }
+    _resolved: Dict[AgentRole, type] = {}
+    
+    @classmethod
+    def create_agent(cls, agent_role: AgentRole, config: Dict[str, Any] = None) -> BaseAgent:
         """Create an agent of the specified role"""
-        # This will be expanded as we implement specific agent types
-        from agents.ingestion_agent import IngestionAgent
-        from agents.analyzer_agent import AnalyzerAgent
-        from agents.semantic_agent import SemanticAgent
+        agent_class = cls._resolved.get(agent_role)
         
-        agent_map = {
-            AgentRole.INGESTION: IngestionAgent,
-            AgentRole.ANALYZER: AnalyzerAgent,
-            AgentRole.SEMANTIC: SemanticAgent,
-            # Add more agents as implemented
-        }
-        
-        if agent_role not in agent_map:
-            raise ValueError(f"Agent role {agent_role} not implemented yet")
+        if agent_class is None:
+            if agent_role not in cls.AGENT_CLASSES:
+                raise ValueError(f"Agent role {agent_role} not implemented yet")
+            
+            module_name, class_name = cls.AGENT_CLASSES[agent_role]
+            agent_class = getattr(importlib.import_module(module_name), class_name)
+            cls._resolved[agent_role] = agent_class
         
-        agent_class = agent_map[agent_role]
         return agent_class(config=config)
 
 if __name__ == "__main__":
@@ -8,29 +8,56 @@ and storing it for analysis. Focused on startup/entrepreneurship content monitor
 """
 
 import asyncio
+import functools
 import json
+import os
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
-import uuid
+import itertools
+from collections import OrderedDict
 import structlog
 import time
 from dataclasses import dataclass
+from types import MappingProxyType
 
 from langchain_core.tools import BaseTool, tool
 from pydantic import BaseModel, Field
 
 # Apify client for TikTok scraping
-from apify_client import ApifyClient
+from apify_client import ApifyClientAsync
 
 from agents.base_agent import BaseAgent, AgentTask, AgentResult, IngestionTask
-from config.definitions import AgentRole
+from agents.apify_ingestion_agent import shared_async_client
+from config.definitions import AgentRole, APIFY_MAX_CONCURRENT_RUNS, APIFY_REQUESTS_PER_SECOND, DATACLASS_SLOTS
 from config.hashtag_targets import get_priority_hashtags, HashtagCategory, STARTUP_ENTREPRENEURSHIP_HASHTAGS
 
+# Top-rated Apify TikTok actors
+_TIKTOK_ACTORS = MappingProxyType({
+    "profile_scraper": "clockworks/tiktok-profile-scraper",  # 9.7K users, 4.8★
+    "hashtag_scraper": "clockworks/tiktok-scraper",          # Main TikTok scraper - pay per event
+    "data_extractor": "clockworks/free-tiktok-scraper",      # 29K users, 4.8★
+    "video_scraper": "clockworks/tiktok-video-scraper",      # 3.5K users, 4.8★
+})
+
+# Cache lifetimes: hashtag scans overlap heavily between runs, profiles change slowly
+_HASHTAG_CACHE_TTL_SECONDS = 3600
+_PROFILE_CACHE_TTL_SECONDS = 86400
+
+# Entry caps so a long-running agent does not keep every hashtag result (with its videos) forever
+_HASHTAG_CACHE_MAX_ENTRIES = 128
+_PROFILE_CACHE_MAX_ENTRIES = 4096
+
+# Profiles requested per profile scraper run
+_PROFILE_BATCH_SIZE = 25
+
+# Keywords for the simple business relevance score
+_BUSINESS_KEYWORDS = ('startup', 'business', 'entrepreneur', 'money', 'success', 'growth')
+
 # =============================================================================
 # APIFY-BASED DATA STRUCTURES  
 # =============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TikTokCreatorData:
     """Real TikTok creator data from Apify"""
     username: str
@@ -44,7 +71,7 @@ class TikTokCreatorData:
     avatar_url: str
     is_private: bool
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TikTokVideoData:
     """Real TikTok video data from Apify"""
     video_id: str
@@ -61,7 +88,7 @@ class TikTokVideoData:
     duration: int
     thumbnail_url: str = ""  # Added for OCR processing
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StartupVideoData:
     """Structured data for startup-related TikTok videos from Apify"""
     video_id: str
@@ -81,7 +108,7 @@ class StartupVideoData:
     viral_score: float
     business_relevance_score: float
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class HashtagTrendData:
     """Structured data for hashtag trend analysis"""
     hashtag: str
@@ -98,6 +125,32 @@ class HashtagTrendData:
 # APIFY SDK CLIENT
 # =============================================================================
 
+class AsyncRateLimiter:
+    """Async token bucket allowing `rate` acquisitions per `period` seconds"""
+    
+    def __init__(self, rate: float, period: float = 1.0):
+        if rate <= 0 or period <= 0:
+            raise ValueError(f"Rate limit must be positive, got {rate} per {period}s (check APIFY_RPS)")
+        self.capacity = rate
+        self.fill_rate = rate / period
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self._lock = None
+    
+    async def acquire(self):
+        """Wait until a token is available, then take it"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.fill_rate)
+
 class ApifyContentIngestion:
     """
     High-quality TikTok content ingestion using Apify actors
@@ -105,20 +158,48 @@ class ApifyContentIngestion:
     
     def __init__(self, api_token: str):
         self.api_token = api_token
-        self.client = ApifyClient(api_token)
+        # Shared async client: one pooled connection set for every ingestion instance
+        self.client: ApifyClientAsync = shared_async_client(api_token)
         self.logger = structlog.get_logger().bind(component="apify_ingestion")
         
-        # Top-rated Apify TikTok actors
-        self.actors = {
-            "profile_scraper": "clockworks/tiktok-profile-scraper",  # 9.7K users, 4.8★
-            "hashtag_scraper": "clockworks/tiktok-scraper",          # Main TikTok scraper - pay per event
-            "data_extractor": "clockworks/free-tiktok-scraper",      # 29K users, 4.8★
-            "video_scraper": "clockworks/tiktok-video-scraper",      # 3.5K users, 4.8★
-        }
+        self.actors = _TIKTOK_ACTORS
+        self.rate_limiter = AsyncRateLimiter(float(os.getenv("APIFY_RPS", APIFY_REQUESTS_PER_SECOND)))
         
-        # Cache for avoiding duplicate requests
-        self.hashtag_cache = {}
-        self.last_cache_clear = datetime.now()
+        # LRU caches for avoiding duplicate requests: key -> (stored_at, value)
+        self.hashtag_cache = OrderedDict()
+        self.profile_cache = OrderedDict()
+        self.last_cache_clear = time.monotonic()
+    
+    def _cache_get(self, cache: Dict, key, ttl_seconds: float):
+        """Return a cached value if it is younger than ttl_seconds"""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > ttl_seconds:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return value
+    
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key, value, max_entries: int, stored_at: Optional[float] = None):
+        """Store value under key, evicting the least recently used entries beyond max_entries"""
+        cache[key] = (time.monotonic() if stored_at is None else stored_at, value)
+        cache.move_to_end(key)
+        while len(cache) > max_entries:
+            cache.popitem(last=False)
+    
+    def _clear_expired_cache(self):
+        """Drop expired entries at most once per hashtag TTL window"""
+        now = time.monotonic()
+        if now - self.last_cache_clear < _HASHTAG_CACHE_TTL_SECONDS:
+            return
+        for cache, ttl in ((self.hashtag_cache, _HASHTAG_CACHE_TTL_SECONDS),
+                           (self.profile_cache, _PROFILE_CACHE_TTL_SECONDS)):
+            for key in [k for k, (stored_at, _) in cache.items() if now - stored_at > ttl]:
+                del cache[key]
+        self.last_cache_clear = now
     
     def _safe_int(self, value):
         """Safely convert values to int"""
@@ -127,6 +208,16 @@ class ApifyContentIngestion:
         except (ValueError, TypeError):
             return 0
     
+    async def _run_actor(self, actor_key: str, run_input: Dict[str, Any], timeout_secs: int) -> Dict[str, Any]:
+        """Start an Apify actor run under the rate limiter and wait for it to finish"""
+        # No retry loop here: call() both starts and polls the run, so retrying it could start a second
+        # paid run, and ApifyClientAsync already retries 429/5xx responses on each request
+        await self.rate_limiter.acquire()
+        return await self.client.actor(self.actors[actor_key]).call(
+            run_input=run_input,
+            timeout_secs=timeout_secs
+        )
+    
     def _calculate_engagement_rate(self, likes: int, comments: int, shares: int, views: int) -> float:
         """Calculate engagement rate"""
         if views == 0:
@@ -148,15 +239,15 @@ class ApifyContentIngestion:
         engagement_rate = self._calculate_engagement_rate(likes, comments, shares, views)
         
         # View-to-follower ratio (viral reach)
-        reach_ratio = views / creator_followers if creator_followers > 0 else 0
+        reach_ratio = views / creator_followers
         
         # Shareability score
-        share_score = shares / max(views, 1)
+        share_score = shares / views if views > 0 else shares
         
-        # Combine metrics (0-100 scale)
-        viral_score = min(100, (engagement_rate * 100 * 0.4) + (reach_ratio * 20) + (share_score * 100 * 0.4))
+        # Combine metrics (0-100 scale); the 100 * 0.4 weights are folded into 40
+        viral_score = engagement_rate * 40 + reach_ratio * 20 + share_score * 40
         
-        return viral_score
+        return viral_score if viral_score < 100 else 100
     
     async def get_creator_profile(self, username: str) -> Optional[TikTokCreatorData]:
         """Get real creator profile data using Apify TikTok Profile Scraper"""
@@ -168,36 +259,18 @@ class ApifyContentIngestion:
                 "resultsType": "details"
             }
             
-            # Run the actor
-            run = self.client.actor(self.actors["profile_scraper"]).call(
-                run_input=run_input,
-                timeout_secs=300
-            )
+            # Awaiting the async client lets concurrent lookups overlap
+            run = await self._run_actor("profile_scraper", run_input, timeout_secs=300)
             
-            # Get the results
-            results = []
-            for item in self.client.dataset(run["defaultDatasetId"]).iterate_items():
-                results.append(item)
+            # Only the first dataset item is used, so stop paging after it
+            profile = None
+            async for item in self.client.dataset(run["defaultDatasetId"]).iterate_items(limit=1):
+                profile = item
             
-            if results:
-                profile = results[0]
-                
+            if profile:
                 # Based on debug output, the profile data structure is different
                 # Let's extract from the authorMeta structure that we see in video results
-                author_meta = profile.get("authorMeta", {})
-                
-                creator_data = TikTokCreatorData(
-                    username=author_meta.get("name", username),
-                    display_name=author_meta.get("nickName", ""),
-                    followers=self._safe_int(author_meta.get("fans", 0)),
-                    following=self._safe_int(author_meta.get("following", 0)), 
-                    likes=self._safe_int(author_meta.get("heart", 0)),
-                    videos=self._safe_int(author_meta.get("video", 0)),
-                    verified=author_meta.get("verified", False),
-                    bio=author_meta.get("signature", ""),
-                    avatar_url=author_meta.get("avatar", ""),
-                    is_private=author_meta.get("privateAccount", False)
-                )
+                creator_data = self._parse_creator_profile(profile.get("authorMeta", {}), username)
                 
                 self.logger.info("Successfully fetched creator profile", 
                                username=username, 
@@ -213,6 +286,76 @@ class ApifyContentIngestion:
             self.logger.error("Error fetching creator profile", username=username, error=str(e))
             return None
     
+    def _parse_creator_profile(self, author_meta: Dict[str, Any], username: str) -> TikTokCreatorData:
+        """Build creator data from a profile scraper authorMeta block"""
+        return TikTokCreatorData(
+            username=author_meta.get("name", username),
+            display_name=author_meta.get("nickName", ""),
+            followers=self._safe_int(author_meta.get("fans", 0)),
+            following=self._safe_int(author_meta.get("following", 0)), 
+            likes=self._safe_int(author_meta.get("heart", 0)),
+            videos=self._safe_int(author_meta.get("video", 0)),
+            verified=author_meta.get("verified", False),
+            bio=author_meta.get("signature", ""),
+            avatar_url=author_meta.get("avatar", ""),
+            is_private=author_meta.get("privateAccount", False)
+        )
+    
+    async def _fetch_profile_batch(self, usernames: List[str]) -> Dict[str, Optional[TikTokCreatorData]]:
+        """Fetch several creator profiles with a single profile scraper run"""
+        try:
+            self.logger.info("Fetching creator profiles", count=len(usernames))
+            
+            run_input = {
+                "profiles": [f"https://www.tiktok.com/@{username}" for username in usernames],
+                "resultsType": "details"
+            }
+            run = await self._run_actor("profile_scraper", run_input, timeout_secs=300)
+            
+            # Match results back to the requested usernames
+            wanted = {username.lower(): username for username in usernames}
+            found = {}
+            async for item in self.client.dataset(run["defaultDatasetId"]).iterate_items():
+                author_meta = item.get("authorMeta", {})
+                username = wanted.get(str(author_meta.get("name", "")).lower())
+                if username and username not in found:
+                    found[username] = self._parse_creator_profile(author_meta, username)
+                    if len(found) == len(wanted):
+                        break
+            
+            return {username: found.get(username) for username in usernames}
+            
+        except Exception as e:
+            self.logger.error("Error fetching creator profiles", count=len(usernames), error=str(e))
+            return dict.fromkeys(usernames)
+    
+    async def get_creator_profiles(self, usernames, max_concurrency: int = APIFY_MAX_CONCURRENT_RUNS) -> Dict[str, Optional[TikTokCreatorData]]:
+        """Fetch profiles for unique usernames in batched runs, bounded by the Apify run limit"""
+        profiles = {}
+        missing = []
+        for username in set(usernames):
+            cached = self._cache_get(self.profile_cache, username, _PROFILE_CACHE_TTL_SECONDS)
+            if cached is not None:
+                profiles[username] = cached
+            else:
+                missing.append(username)
+        
+        # One scraper run per batch of usernames instead of one per creator
+        batches = [missing[i:i + _PROFILE_BATCH_SIZE] for i in range(0, len(missing), _PROFILE_BATCH_SIZE)]
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch(batch: List[str]):
+            async with semaphore:
+                return await self._fetch_profile_batch(batch)
+        
+        now = time.monotonic()
+        for batch_profiles in await asyncio.gather(*(fetch(batch) for batch in batches)):
+            for username, profile in batch_profiles.items():
+                profiles[username] = profile
+                if profile is not None:
+                    self._cache_put(self.profile_cache, username, profile, _PROFILE_CACHE_MAX_ENTRIES, now)
+        return profiles
+    
     async def get_hashtag_videos(self, hashtag: str, max_videos: int = 50) -> List[TikTokVideoData]:
         """Get real videos for a hashtag using Apify TikTok Hashtag Scraper"""
         try:
@@ -227,45 +370,42 @@ class ApifyContentIngestion:
             }
             
             # Run the actor
-            run = self.client.actor(self.actors["hashtag_scraper"]).call(
-                run_input=run_input,
-                timeout_secs=600
-            )
+            run = await self._run_actor("hashtag_scraper", run_input, timeout_secs=600)
             
             # Get the results
             videos = []
-            for item in self.client.dataset(run["defaultDatasetId"]).iterate_items():
+            safe_int = self._safe_int
+            async for item in self.client.dataset(run["defaultDatasetId"]).iterate_items():
+                get = item.get
                 
                 # Extract hashtags from description
-                desc = item.get("text", "")
-                hashtags = []
-                words = desc.split()
-                for word in words:
-                    if word.startswith("#"):
-                        hashtags.append(word[1:])  # Remove #
+                desc = get("text", "")
+                hashtags = [word[1:] for word in desc.split() if word.startswith("#")]
                 
                 # Extract thumbnail URL
-                video_meta = item.get("videoMeta", {})
+                video_meta = get("videoMeta", {})
+                covers = video_meta.get("covers")
                 thumbnail_url = (
-                    video_meta.get("covers", [""])[0] if video_meta.get("covers") else
+                    covers[0] if covers else
                     video_meta.get("coverUrl", "") or
-                    item.get("thumbnail_url", "") or
-                    item.get("covers", {}).get("default", "")
+                    get("thumbnail_url", "") or
+                    get("covers", {}).get("default", "")
                 )
+                create_time = get("createTime")
                 
                 video_data = TikTokVideoData(
-                    video_id=item.get("id", ""),
-                    creator_username=item.get("authorMeta", {}).get("name", ""),
+                    video_id=get("id", ""),
+                    creator_username=get("authorMeta", {}).get("name", ""),
                     description=desc,
-                    views=self._safe_int(item.get("playCount", 0)),
-                    likes=self._safe_int(item.get("diggCount", 0)),
-                    comments=self._safe_int(item.get("commentCount", 0)),
-                    shares=self._safe_int(item.get("shareCount", 0)),
-                    created_at=datetime.fromtimestamp(item.get("createTime", 0)) if item.get("createTime") else datetime.now(),
-                    video_url=item.get("webVideoUrl", ""),
+                    views=safe_int(get("playCount", 0)),
+                    likes=safe_int(get("diggCount", 0)),
+                    comments=safe_int(get("commentCount", 0)),
+                    shares=safe_int(get("shareCount", 0)),
+                    created_at=datetime.fromtimestamp(create_time) if create_time else datetime.now(),
+                    video_url=get("webVideoUrl", ""),
                     hashtags=hashtags,
-                    music_title=item.get("musicMeta", {}).get("musicName", ""),
-                    duration=self._safe_int(item.get("videoMeta", {}).get("duration", 0)),
+                    music_title=get("musicMeta", {}).get("musicName", ""),
+                    duration=safe_int(video_meta.get("duration", 0)),
                     thumbnail_url=thumbnail_url
                 )
                 videos.append(video_data)
@@ -291,14 +431,11 @@ class ApifyContentIngestion:
             }
             
             # Run the profile scraper actor
-            run = self.client.actor(self.actors["profile_scraper"]).call(
-                run_input=run_input,
-                timeout_secs=600
-            )
+            run = await self._run_actor("profile_scraper", run_input, timeout_secs=600)
             
             # Get the results
             videos = []
-            for item in self.client.dataset(run["defaultDatasetId"]).iterate_items():
+            async for item in self.client.dataset(run["defaultDatasetId"]).iterate_items():
                 
                 # Extract hashtags from description
                 desc = item.get("text", "")
@@ -344,7 +481,21 @@ class ApifyContentIngestion:
             return []
 
     async def collect_startup_hashtag_data(self, hashtag: str, max_videos: int = 50) -> Dict[str, Any]:
-        """Collect and analyze startup-related hashtag data"""
+        """Collect and analyze startup-related hashtag data, reusing results younger than the cache TTL"""
+        self._clear_expired_cache()
+        cache_key = (hashtag, max_videos)
+        cached = self._cache_get(self.hashtag_cache, cache_key, _HASHTAG_CACHE_TTL_SECONDS)
+        if cached is not None:
+            self.logger.info("Using cached hashtag data", hashtag=hashtag)
+            return cached
+        
+        result = await self._collect_startup_hashtag_data(hashtag, max_videos)
+        if result.get("success"):
+            self._cache_put(self.hashtag_cache, cache_key, result, _HASHTAG_CACHE_MAX_ENTRIES)
+        return result
+    
+    async def _collect_startup_hashtag_data(self, hashtag: str, max_videos: int) -> Dict[str, Any]:
+        """Uncached collection for a single hashtag"""
         try:
             # Get videos for the hashtag
             videos = await self.get_hashtag_videos(hashtag, max_videos)
@@ -356,11 +507,13 @@ class ApifyContentIngestion:
                     "hashtag": hashtag
                 }
             
+            # Get creator data for follower count (one lookup per creator, fetched concurrently)
+            creator_profiles = await self.get_creator_profiles(video.creator_username for video in videos)
+            
             # Process videos into startup data format
             startup_videos = []
             for video in videos:
-                # Get creator data for follower count
-                creator_data = await self.get_creator_profile(video.creator_username)
+                creator_data = creator_profiles.get(video.creator_username)
                 creator_followers = creator_data.followers if creator_data else 0
                 creator_verified = creator_data.verified if creator_data else False
                 
@@ -373,9 +526,9 @@ class ApifyContentIngestion:
                 )
                 
                 # Business relevance score (simple keyword matching for now)
-                business_keywords = ['startup', 'business', 'entrepreneur', 'money', 'success', 'growth']
-                business_relevance = sum(1 for keyword in business_keywords 
-                                       if keyword.lower() in video.description.lower()) / len(business_keywords)
+                description_lower = video.description.lower()
+                business_relevance = sum(keyword in description_lower 
+                                         for keyword in _BUSINESS_KEYWORDS) / len(_BUSINESS_KEYWORDS)
                 
                 startup_video = StartupVideoData(
                     video_id=video.video_id,
@@ -407,7 +560,7 @@ class ApifyContentIngestion:
                 "startup_videos": startup_videos,
                 "collection_timestamp": datetime.now(),
                 "avg_viral_score": sum(v.viral_score for v in startup_videos) / len(startup_videos),
-                "top_creators": list(set([v.creator_username for v in startup_videos[:10]]))
+                "top_creators": list({v.creator_username for v in startup_videos[:10]})
             }
             
         except Exception as e:
@@ -444,6 +597,20 @@ def analyze_startup_video(video_url: str) -> str:
 # UPDATED INGESTION AGENT
 # =============================================================================
 
+def _ingestion_step(error_event: str):
+    """Decorate an ingest_* coroutine so any exception becomes a logged, failed AgentResult"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await func(self, *args, **kwargs)
+            except Exception as e:
+                self.logger.error(error_event, args=args, error=str(e))
+                return self._result(started, success=False, error=str(e))
+        return wrapper
+    return decorator
+
 class IngestionAgent(BaseAgent):
     """
     Agent responsible for ingesting startup/business content from TikTok via Apify APIs
@@ -460,6 +627,9 @@ class IngestionAgent(BaseAgent):
         # Initialize Apify content ingestion
         self.apify_ingestion = ApifyContentIngestion(api_token)
         
+        # Result ids only need to be unique within this agent, so a counter beats uuid4
+        self._result_ids = itertools.count(1)
+        
         # LangChain tools for startup monitoring
         tools = [monitor_startup_trends, analyze_startup_video]
         
@@ -473,93 +643,106 @@ class IngestionAgent(BaseAgent):
         
         self.logger.info("Apify Ingestion Agent initialized", api_token_length=len(api_token))
     
+    def _next_result_id(self) -> str:
+        return f"ingest_{next(self._result_ids):08x}"
+    
     def _create_agent(self):
         """Create LangChain agent for startup content ingestion"""
         # For now, return None since we're using the SDK directly
         # In future, this could create a LangChain agent with LLM reasoning
         return None
     
+    async def _handle_startup_trends(self, parameters: Dict[str, Any]) -> AgentResult:
+        return await self.ingest_startup_trends(parameters.get('hashtag_list'))
+    
+    async def _handle_hashtag_analysis(self, parameters: Dict[str, Any]) -> AgentResult:
+        return await self.ingest_hashtag_videos(parameters.get('hashtag'), parameters.get('count', 50))
+    
+    # task_type -> handler, looked up once per task instead of walking an if/elif chain
+    _TASK_HANDLERS = {
+        "startup_trends": _handle_startup_trends,
+        "hashtag_analysis": _handle_hashtag_analysis,
+    }
+    
     async def execute_task(self, task) -> AgentResult:
         """Execute ingestion task"""
-        if hasattr(task, 'task_type'):
-            if task.task_type == "startup_trends":
-                return await self.ingest_startup_trends(task.parameters.get('hashtag_list'))
-            elif task.task_type == "hashtag_analysis":
-                hashtag = task.parameters.get('hashtag')
-                count = task.parameters.get('count', 50)
-                return await self.ingest_hashtag_videos(hashtag, count)
+        handler = self._TASK_HANDLERS.get(getattr(task, 'task_type', None))
+        if handler is not None:
+            return await handler(self, task.parameters)
         
         # Default: ingest startup trends
         return await self.ingest_startup_trends()
     
+    def _result(self, started: float, success: bool, result_data: Dict[str, Any] = None,
+                error: Optional[str] = None, **metadata) -> AgentResult:
+        """AgentResult for an ingestion run that began at `started` (time.perf_counter())"""
+        return AgentResult(
+            task_id=self._next_result_id(),
+            agent_name=self.agent_name,
+            success=success,
+            result_data=result_data or {},
+            error_message=error,
+            execution_time_seconds=time.perf_counter() - started,
+            metadata=metadata
+        )
+    
+    @_ingestion_step("Error in startup trends ingestion")
     async def ingest_startup_trends(self, hashtag_list: List[str] = None) -> AgentResult:
         """Ingest trending startup content"""
-        try:
-            if not hashtag_list:
-                hashtag_list = get_priority_hashtags(HashtagCategory.STARTUP_BASIC)
-            
-            all_results = {}
-            
-            for hashtag in hashtag_list[:5]:  # Limit to 5 hashtags to avoid rate limits
-                result = await self.apify_ingestion.collect_startup_hashtag_data(hashtag, max_videos=20)
-                
-                if result.get("success"):
-                    all_results[hashtag] = result
-                    self.logger.info("Successfully ingested hashtag", 
-                                   hashtag=hashtag, 
-                                   videos=result.get("total_videos", 0))
-                else:
-                    self.logger.warning("Failed to ingest hashtag", 
-                                      hashtag=hashtag, 
-                                      error=result.get("error"))
-            
-            return AgentResult(
-                agent_name=self.agent_name,
-                task_id=str(uuid.uuid4()),
-                success=len(all_results) > 0,
-                data=all_results,
-                metadata={
-                    "hashtags_processed": len(all_results),
-                    "total_hashtags_attempted": len(hashtag_list),
-                    "timestamp": datetime.now()
-                }
-            )
+        started = time.perf_counter()
+        if not hashtag_list:
+            hashtag_list = get_priority_hashtags(HashtagCategory.STARTUP_BASIC)
+        
+        all_results = {}
+        hashtags = hashtag_list[:5]  # Limit to 5 hashtags to avoid rate limits
+        semaphore = asyncio.Semaphore(APIFY_MAX_CONCURRENT_RUNS)
+        
+        async def collect(hashtag: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.apify_ingestion.collect_startup_hashtag_data(hashtag, max_videos=20)
+        
+        # Hashtags are independent; run them together and keep one failure from sinking the rest
+        results = await asyncio.gather(*(collect(hashtag) for hashtag in hashtags), return_exceptions=True)
+        
+        failures = {}
+        for hashtag, result in zip(hashtags, results):
+            if isinstance(result, Exception):
+                result = {"success": False, "error": str(result)}
             
-        except Exception as e:
-            self.logger.error("Error in startup trends ingestion", error=str(e))
-            return AgentResult(
-                agent_name=self.agent_name,
-                task_id=str(uuid.uuid4()),
-                success=False,
-                error=str(e)
-            )
+            if result.get("success"):
+                all_results[hashtag] = result
+                self.logger.info("Successfully ingested hashtag", 
+                               hashtag=hashtag, 
+                               videos=result.get("total_videos", 0))
+            else:
+                failures[hashtag] = result.get("error")
+        
+        # One record for all failures instead of a warning per hashtag
+        if failures:
+            self.logger.warning("Failed to ingest hashtags", count=len(failures), failures=failures)
+        
+        return self._result(
+            started,
+            success=len(all_results) > 0,
+            result_data=all_results,
+            hashtags_processed=len(all_results),
+            total_hashtags_attempted=len(hashtag_list)
+        )
     
+    @_ingestion_step("Error in hashtag video ingestion")
     async def ingest_hashtag_videos(self, hashtag: str, count: int = 50) -> AgentResult:
         """Ingest videos for a specific hashtag"""
-        try:
-            result = await self.apify_ingestion.collect_startup_hashtag_data(hashtag, max_videos=count)
-            
-            return AgentResult(
-                agent_name=self.agent_name,
-                task_id=str(uuid.uuid4()),
-                success=result.get("success", False),
-                data=result,
-                metadata={
-                    "hashtag": hashtag,
-                    "videos_requested": count,
-                    "videos_found": result.get("total_videos", 0),
-                    "timestamp": datetime.now()
-                }
-            )
-            
-        except Exception as e:
-            self.logger.error("Error in hashtag video ingestion", hashtag=hashtag, error=str(e))
-            return AgentResult(
-                agent_name=self.agent_name,
-                task_id=str(uuid.uuid4()),
-                success=False,
-                error=str(e)
-            )
+        started = time.perf_counter()
+        result = await self.apify_ingestion.collect_startup_hashtag_data(hashtag, max_videos=count)
+        
+        return self._result(
+            started,
+            success=result.get("success", False),
+            result_data=result,
+            hashtag=hashtag,
+            videos_requested=count,
+            videos_found=result.get("total_videos", 0)
+        )
 
 # =============================================================================
 # TESTING & EXAMPLES
@@ -589,10 +772,10 @@ async def test_apify_ingestion():
     if result.success:
         print("✅ Startup trends ingestion: SUCCESS")
         print(f"   Hashtags processed: {result.metadata.get('hashtags_processed')}")
-        for hashtag, data in result.data.items():
+        for hashtag, data in result.result_data.items():
             print(f"   #{hashtag}: {data.get('total_videos', 0)} videos")
     else:
-        print(f"❌ Startup trends ingestion: FAILED - {result.error}")
+        print(f"❌ Startup trends ingestion: FAILED - {result.error_message}")
 
 if __name__ == "__main__":
     import os
@@ -10,6 +10,7 @@ ONLY Claude Opus 4 - No other LLMs needed.
 """
 
 import asyncio
+import functools
 import os
 import time
 from typing import Dict, Any, Optional
@@ -23,11 +24,24 @@ pass
 # Claude integration
 try:
     import anthropic
+    import httpx
     ANTHROPIC_AVAILABLE = True
 except ImportError:
     ANTHROPIC_AVAILABLE = False
     print("⚠️ Anthropic not available. Install with: pip install anthropic")
 
+# HTTP/2 lets concurrent analyses share one connection; it needs the optional h2 package
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Model identifier and pricing (USD per 1K tokens)
+CLAUDE_MODEL = "claude-opus-4-20250514"
+COST_PER_1K_INPUT = 0.015
+COST_PER_1K_OUTPUT = 0.075
+
 class ClaudePrimarySystem:
     """Simplified AI system using only Claude Opus 4"""
     
@@ -45,12 +59,21 @@ class ClaudePrimarySystem:
         self.claude_client = self._initialize_claude()
         self.claude_available = self.claude_client is not None
         
+        # Model details never change after init, so the status block is built once
+        self._model_status = {
+            "available": self.claude_available,
+            "model": CLAUDE_MODEL,
+            "cost_per_1k_input": COST_PER_1K_INPUT,
+            "cost_per_1k_output": COST_PER_1K_OUTPUT,
+            "speed": "Premium (3-5s)"
+        }
+        
         if self.claude_available:
             print("✅ Claude Opus 4 initialized successfully")
         else:
             print("❌ Claude Opus 4 not available - check API key")
     
-    def _initialize_claude(self) -> Optional[anthropic.Anthropic]:
+    def _initialize_claude(self) -> Optional["anthropic.AsyncAnthropic"]:
         """Initialize Claude Opus 4 client"""
         api_key = os.getenv('ANTHROPIC_API_KEY')
         
@@ -65,15 +88,21 @@ class ClaudePrimarySystem:
 
         try:
             print(f"🔑 [LLM] Initializing Claude client with key: {api_key[:20]}...")
-            client = anthropic.Anthropic(api_key=api_key)
+            # One pooled keep-alive HTTP client for the life of the process
+            http_client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+                timeout=httpx.Timeout(600.0, connect=10.0)
+            )
+            client = anthropic.AsyncAnthropic(api_key=api_key, http_client=http_client)
             print("✅ [LLM] Claude client initialized successfully")
             return client
         except Exception as e:
             print(f"❌ [LLM] Failed to initialize Claude: {str(e)}")
             return None
     
-    async def analyze(self, prompt: str, **kwargs) -> Dict[str, Any]:
-        """Main analysis method using Claude Opus 4"""
+    async def analyze(self, prompt: str, system: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """Main analysis method using Claude Opus 4; a static system prompt is marked for prompt caching"""
         print(f"🤖 [LLM] Starting Claude analysis...")
         print(f"📝 [LLM] Prompt preview: {prompt[:100]}..." if len(prompt) > 100 else f"📝 [LLM] Prompt: {prompt}")
         
@@ -92,18 +121,22 @@ class ClaudePrimarySystem:
         
         try:
             print("🚀 [LLM] Sending request to Claude Opus 4...")
+            request = {
+                "model": CLAUDE_MODEL,
+                "max_tokens": kwargs.get("max_tokens", 2000),
+                "temperature": kwargs.get("temperature", 0.3),
+                "messages": [{"role": "user", "content": prompt}]
+            }
+            if system:
+                # Identical system prefixes are served from Anthropic's prompt cache
+                request["system"] = [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
             # Claude Opus 4 API call
-            response = self.claude_client.messages.create(
-                model="claude-opus-4-20250514",
-                max_tokens=kwargs.get("max_tokens", 2000),
-                temperature=kwargs.get("temperature", 0.3),
-                messages=[{"role": "user", "content": prompt}]
-            )
+            response = await self.claude_client.messages.create(**request)
             
             # Calculate cost (Claude Opus 4 pricing)
-            input_tokens = len(prompt.split()) * 1.3  # Rough estimate
+            input_tokens = (len(prompt.split()) + len((system or "").split())) * 1.3  # Rough estimate
             output_tokens = len(response.content[0].text.split()) * 1.3
-            cost = (input_tokens * 0.015 + output_tokens * 0.075) / 1000
+            cost = (input_tokens * COST_PER_1K_INPUT + output_tokens * COST_PER_1K_OUTPUT) / 1000
             
             # Update stats
             response_time = time.time() - start_time
@@ -121,7 +154,7 @@ class ClaudePrimarySystem:
             return {
                 "success": True,
                 "response": response.content[0].text,
-                "model": "claude-opus-4-20250514",
+                "model": CLAUDE_MODEL,
                 "tokens": int(input_tokens + output_tokens),
                 "cost": cost,
                 "response_time": response_time,
@@ -136,21 +169,22 @@ class ClaudePrimarySystem:
                 "success": False,
                 "error": str(e),
                 "response": f"Claude analysis failed: {str(e)}",
-                "model": "claude-opus-4-20250514",
+                "model": CLAUDE_MODEL,
                 "cost": 0.0,
                 "response_time": response_time
             }
     
+    async def aclose(self):
+        """Close the pooled HTTP connections"""
+        if self.claude_client is not None:
+            await self.claude_client.close()
+            self.claude_client = None
+            self.claude_available = False
+    
     def get_system_status(self) -> Dict[str, Any]:
         """Get current system status"""
         return {
-            "claude_opus_4": {
-                "available": self.claude_available,
-                "model": "claude-opus-4-20250514",
-                "cost_per_1k_input": 0.015,
-                "cost_per_1k_output": 0.075,
-                "speed": "Premium (3-5s)"
-            },
+            "claude_opus_4": self._model_status,
             "session_stats": self.session_stats,
             "system_type": "Claude Primary (Simplified)"
         }
@@ -172,14 +206,28 @@ class ClaudePrimarySystem:
 🎯 Success Rate: {(stats['successful_queries']/max(stats['total_queries'],1)*100):.1f}%
 """
 
-# Create global instance
-ai_system = ClaudePrimarySystem()
+@functools.lru_cache(maxsize=1)
+def get_ai_system() -> ClaudePrimarySystem:
+    """Process-wide Claude system, created on first use so importing this module stays cheap"""
+    return ClaudePrimarySystem()
+
+async def shutdown_ai_system():
+    """Close the shared Claude system at process shutdown; the next get_ai_system() builds a fresh one"""
+    if get_ai_system.cache_info().currsize:
+        await get_ai_system().aclose()
+        get_ai_system.cache_clear()
+
+def __getattr__(name):
+    # Keep `from ai.claude_primary_system import ai_system` working without an import-time client
+    if name == "ai_system":
+        return get_ai_system()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Convenience functions for backward compatibility
 async def analyze_content(prompt: str, **kwargs) -> Dict[str, Any]:
     """Analyze content using Claude Opus 4"""
     print("📋 [LLM-WRAPPER] analyze_content() called")
-    return await ai_system.analyze(prompt, **kwargs)
+    return await get_ai_system().analyze(prompt, **kwargs)
 
 async def analyze_trends(trends_data: str, **kwargs) -> Dict[str, Any]:
     """Analyze trends using Claude Opus 4"""
@@ -197,7 +245,7 @@ Provide:
 
 Focus on actionable insights for content creators.
 """
-    return await ai_system.analyze(trend_prompt, **kwargs)
+    return await get_ai_system().analyze(trend_prompt, **kwargs)
 
 async def analyze_hashtags(hashtag_data: str, **kwargs) -> Dict[str, Any]:
     """Analyze hashtags using Claude Opus 4"""
@@ -215,7 +263,7 @@ Provide:
 
 Focus on maximizing reach and engagement.
 """
-    return await ai_system.analyze(hashtag_prompt, **kwargs)
+    return await get_ai_system().analyze(hashtag_prompt, **kwargs)
 
 if __name__ == "__main__":
     import asyncio
@@ -224,6 +272,7 @@ if __name__ == "__main__":
         print("🧪 Testing Claude Primary System...")
         
         # Test basic analysis
+        ai_system = get_ai_system()
         result = await ai_system.analyze("Analyze this sample trend: #aesthetic is exploding with 50% growth in 24 hours")
         
         if result["success"]:
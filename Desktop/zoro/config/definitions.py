@@ -10,6 +10,11 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional
 from enum import Enum
 import datetime
+import sys
+
+# Keyword args for record dataclasses created in bulk: slots drop the per-instance
+# __dict__ on Python 3.10+, where @dataclass supports them
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 # =============================================================================
 # VIRAL SUCCESS DEFINITIONS
@@ -221,6 +226,7 @@ LOG_RETENTION_DAYS = 90
 
 # Rate limiting and API constraints
 APIFY_MAX_CONCURRENT_RUNS = 5
+APIFY_REQUESTS_PER_SECOND = 10  # override with APIFY_RPS
 APIFY_DEFAULT_TIMEOUT_SECONDS = 600
 MAX_CONCURRENT_LLM_REQUESTS = 5
 MAX_FEATURE_COMPUTATION_BATCH_SIZE = 1000
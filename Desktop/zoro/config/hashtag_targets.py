@@ -6,6 +6,8 @@ Defines specific hashtag categories and targets for viral trend detection.
 These hashtags are actively monitored for viral potential.
 """
 
+import datetime
+import functools
 from dataclasses import dataclass
 from typing import Dict, List, Set
 from enum import Enum
@@ -24,9 +26,9 @@ class HashtagCategory(Enum):
     SEASONAL = "seasonal"                     # Seasonal/holiday content
     EMERGING = "emerging"                     # Newly discovered trends
 
-@dataclass
+@dataclass(frozen=True)
 class HashtagTarget:
-    """Configuration for monitoring a specific hashtag"""
+    """Configuration for monitoring a specific hashtag (frozen: instances are shared by the cached lookups)"""
     hashtag: str
     category: HashtagCategory
     priority: int  # 1=highest, 5=lowest
@@ -187,10 +189,11 @@ STARTUP_ENTREPRENEURSHIP_HASHTAGS = [
 
 def get_seasonal_hashtags() -> List[HashtagTarget]:
     """Returns season-appropriate hashtags based on current date"""
-    import datetime
-    now = datetime.datetime.now()
-    month = now.month
-    
+    return list(_seasonal_hashtags_for_month(datetime.datetime.now().month))
+
+@functools.lru_cache(maxsize=12)
+def _seasonal_hashtags_for_month(month: int) -> tuple:
+    """Seasonal targets for a month, built once per month value"""
     seasonal_hashtags = []
     
     # Winter (Dec, Jan, Feb)
@@ -224,7 +227,7 @@ def get_seasonal_hashtags() -> List[HashtagTarget]:
             HashtagTarget("#thanksgiving", HashtagCategory.SEASONAL, 1, 1.5, 3000, 25),
         ])
     
-    return seasonal_hashtags
+    return tuple(seasonal_hashtags)
 
 # =============================================================================
 # MASTER HASHTAG CONFIGURATION
@@ -232,6 +235,11 @@ def get_seasonal_hashtags() -> List[HashtagTarget]:
 
 def get_all_hashtag_targets() -> List[HashtagTarget]:
     """Returns all hashtag targets combined"""
+    return list(_all_hashtag_targets_for_month(datetime.datetime.now().month))
+
+@functools.lru_cache(maxsize=12)
+def _all_hashtag_targets_for_month(month: int) -> tuple:
+    """Combined targets for a month; callers get a fresh list copy"""
     all_hashtags = []
     all_hashtags.extend(VIRAL_INDICATORS)
     all_hashtags.extend(ENTERTAINMENT_HASHTAGS)
@@ -241,9 +249,9 @@ def get_all_hashtag_targets() -> List[HashtagTarget]:
     all_hashtags.extend(FASHION_BEAUTY_HASHTAGS)
     all_hashtags.extend(GAMING_HASHTAGS)
     all_hashtags.extend(STARTUP_ENTREPRENEURSHIP_HASHTAGS)
-    all_hashtags.extend(get_seasonal_hashtags())
+    all_hashtags.extend(_seasonal_hashtags_for_month(month))
     
-    return all_hashtags
+    return tuple(all_hashtags)
 
 def get_priority_hashtags(max_priority: int = 2) -> List[HashtagTarget]:
     """Returns only high-priority hashtags for resource-constrained monitoring"""
@@ -7,43 +7,45 @@ Loads environment variables from .env file for the TikTok trend analyzer.
 Simplified for Claude Opus 4 primary system.
 """
 
+import functools
 import os
+import re
 from pathlib import Path
 
+# KEY=VALUE lines with optional `export` prefix and single/double quoted values
+_ENV_LINE = re.compile(
+    r"""^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(?:"([^"]*)"|'([^']*)'|(.*?))\s*$""",
+    re.MULTILINE,
+)
+
+# Keys the Claude Primary system needs; when all are exported a missing .env is not an error
+ESSENTIAL_KEYS = ('ANTHROPIC_API_KEY', 'APIFY_API_TOKEN')
+
+@functools.lru_cache(maxsize=None)
 def load_env_file(env_path: str = ".env"):
-    """Load environment variables from .env file"""
+    """Load environment variables from .env file (once per path per process)"""
     env_file = Path(env_path)
     
     if not env_file.exists():
+        if all(os.getenv(key) for key in ESSENTIAL_KEYS):
+            return True
         print(f"⚠️ .env file not found at {env_file.absolute()}")
         print("Create a .env file with your API keys")
         return False
     
     print(f"📁 Loading environment from {env_file.absolute()}")
     
-    with open(env_file, 'r') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
-            
-            # Parse KEY=VALUE format
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-                
-                # Set environment variable
-                os.environ[key] = value
-                print(f"✅ Loaded {key}: {value[:20]}...")
+    verbose = bool(os.environ.get("ZORO_VERBOSE_ENV"))
+    for match in _ENV_LINE.finditer(env_file.read_text()):
+        key, double_quoted, single_quoted, bare = match.groups()
+        value = next(v for v in (double_quoted, single_quoted, bare) if v is not None)
+        
+        # Exported variables win over the .env file
+        if key in os.environ:
+            continue
+        os.environ[key] = value
+        if verbose:
+            print(f"✅ Loaded {key}: {value[:20]}...")
     
     return True
 
@@ -54,9 +56,7 @@ if __name__ == "__main__":
     if success:
         print("\n📊 Current environment variables:")
         # Only check essential keys for Claude Primary system
-        essential_keys = ['ANTHROPIC_API_KEY', 'APIFY_API_TOKEN']
-        
-        for key in essential_keys:
+        for key in ESSENTIAL_KEYS:
             value = os.getenv(key)
             if value:
                 print(f"✅ {key}: {value[:20]}...")
@@ -6,11 +6,25 @@ Clean, modular pipeline for TikTok trending analysis.
 Each component has a single responsibility.
 """
 
-from .scraper import TikTokScraper
-from .ocr_processor import OCRProcessor  
-# LLMAnalyzer imported lazily to avoid early Claude initialization
-from .metrics import MetricsCalculator
-from .storage import DataStorage
+import importlib
+
+# Components are imported on first access so that e.g. ``pipeline.llm_analyzer``
+# does not drag in PIL/pytesseract/numpy just by importing the package
+_LAZY_EXPORTS = {
+    'TikTokScraper': '.scraper',
+    'OCRProcessor': '.ocr_processor',
+    # LLMAnalyzer imported lazily to avoid early Claude initialization
+    'MetricsCalculator': '.metrics',
+    'DataStorage': '.storage',
+}
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     'TikTokScraper',
@@ -5,7 +5,9 @@ LLM Analysis Component
 Uses Claude Opus 4 for trending analysis and insights.
 """
 
+import hashlib
 import json
+import re
 from typing import Dict, List, Any
 import sys
 import os
@@ -13,54 +15,139 @@ import os
 # Add parent directory to import Claude
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Claude imported lazily to avoid early initialization
+from pipeline.llm_cache import get_llm_cache
+
+# orjson is optional; compact prompt JSON is cheaper in tokens either way
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _dumps_compact(data) -> str:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, default=str, ensure_ascii=False, separators=(',', ':'))
+
+# OCR leftovers: non-ASCII glyphs and runs of stray punctuation
+_OCR_NOISE_RE = re.compile(r"[^\x20-\x7e]+|([.,:;'`~_=-])\1+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+VIDEO_SCHEMA = ["author", "text", "ocr", "views", "er", "tags"]
+TRANSCRIPT_SCHEMA = ["transcript", "author", "views", "tags"]
+
+def _compact_ocr(text: str, limit: int = 200) -> str:
+    return _WHITESPACE_RE.sub(" ", _OCR_NOISE_RE.sub(" ", text or "")).strip()[:limit]
+
+def _video_table(videos: List[Dict], limit: int = 20) -> Dict[str, Any]:
+    """Columnar video payload: key names are sent once in the schema instead of per row"""
+    return {"schema": VIDEO_SCHEMA, "rows": [[
+        video.get('author', ''),
+        video.get('text', '')[:200],
+        _compact_ocr(video.get('ocr_text', '')),
+        video.get('views', 0),
+        video.get('engagement_rate', 0),
+        video.get('hashtags', [])[:5]
+    ] for video in videos[:limit]]}
+
+def prompt_json(data) -> str:
+    """Compact JSON for prompts; lists of records are written one record per line"""
+    if isinstance(data, list):
+        return "\n".join(_dumps_compact(item) for item in data)
+    return _dumps_compact(data)
+
+# Static instructions go in the system block so Anthropic prompt caching can reuse them;
+# per-call data is sent afterwards in the user message
+_TRENDING_SYSTEM = """You analyze trending TikTok videos for topic trends. The user message contains the VIDEO DATA.
+
+Provide analysis on:
+
+1. **TRENDING TOPICS**: What topics are gaining momentum?
+2. **HASHTAG TRENDS**: Which hashtags are performing best?
+3. **CONTENT PATTERNS**: What content types are viral?
+4. **THUMBNAIL TEXT INSIGHTS**: What do thumbnails reveal about trends?
+5. **AUDIENCE BEHAVIOR**: What's resonating with viewers?
+
+Return structured insights with specific examples and data."""
+
+_HASHTAG_SYSTEM = """You analyze TikTok hashtag momentum. The user message contains the HASHTAG DATA.
+
+Provide insights on:
+
+1. **MOMENTUM PATTERNS**: Which hashtags are growing fastest?
+2. **USAGE TRENDS**: How are successful hashtags being used?
+3. **COMBINATION STRATEGIES**: Which hashtag combos work best?
+4. **TIMING INSIGHTS**: When do these hashtags perform best?
+5. **PREDICTIONS**: Which hashtags will likely trend next?
+
+Focus on actionable insights for content creators."""
+
+_EMERGING_SYSTEM = """You analyze TikTok transcripts to identify EMERGING TOPICS and trends. The user message contains RECENT PERIOD TRANSCRIPTS, COMPARISON PERIOD TRANSCRIPTS and the HASHTAGS BEING ANALYZED.
+
+Please provide analysis on:
+
+1. **EMERGING TOPICS**: What NEW subjects/themes appear in recent transcripts but NOT in comparison transcripts?
+
+2. **TOPIC EVOLUTION**: How have existing topics changed or evolved between the two periods?
+
+3. **LANGUAGE PATTERNS**: What new phrases, terminology, or speaking patterns are emerging?
+
+4. **CONTENT SHIFTS**: What shifts in content focus or messaging do you detect?
+
+5. **TREND PREDICTIONS**: Based on these emerging patterns, what trends might develop next?
+
+6. **HASHTAG RELEVANCE**: How do these emerging topics relate to the hashtags being analyzed?
+
+Focus on actionable insights about genuine emerging trends vs temporary variations."""
+
+_RECOMMENDATIONS_SYSTEM = """You create specific TikTok content recommendations from a trending analysis. The user message contains the ANALYSIS DATA.
+
+Generate:
+
+1. **5 SPECIFIC VIDEO IDEAS** that would likely go viral
+2. **OPTIMAL HASHTAG COMBOS** for each video idea
+3. **THUMBNAIL TEXT SUGGESTIONS** based on successful patterns
+4. **POSTING TIMING** recommendations
+5. **CONTENT HOOKS** that are currently working
+
+Make recommendations specific and actionable."""
 
 class LLMAnalyzer:
     """Handles AI analysis using Claude Opus 4"""
     
     def __init__(self):
         self.claude = None  # Initialize lazily when first needed
+        # Emerging-topics results keyed by a hash of the transcripts and hashtags they were computed from
+        self._emerging_results: Dict[str, Dict[str, Any]] = {}
         
     def _ensure_claude_initialized(self):
         """Lazy initialization of Claude to ensure environment is loaded first"""
         if self.claude is None:
             print("🤖 [LLM] Lazy loading Claude Opus 4...")
-            from ai.claude_primary_system import ClaudePrimarySystem
-            self.claude = ClaudePrimarySystem()
+        from ai.claude_primary_system import get_ai_system
+        # Re-resolved on every call so a shut-down shared system is replaced, never reused
+        self.claude = get_ai_system()
+    
+    async def _analyze(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """Call Claude through the shared response cache when it is enabled"""
+        cache = get_llm_cache()
+        if cache is None:
+            return await self.claude.analyze(prompt, **kwargs)
+        return await cache.analyze(self.claude, prompt, **kwargs)
     
     async def analyze_trending_topics(self, videos: List[Dict]) -> Dict[str, Any]:
         """Analyze trending topics from video data"""
         self._ensure_claude_initialized()
         
-        # Prepare data for Claude
-        video_data = []
-        for video in videos[:20]:  # Top 20 for analysis
-            video_data.append({
-                'author': video.get('author', ''),
-                'text': video.get('text', '')[:200],
-                'ocr_text': video.get('ocr_text', ''),
-                'views': video.get('views', 0),
-                'engagement_rate': video.get('engagement_rate', 0),
-                'hashtags': video.get('hashtags', [])[:5]
-            })
+        # Prepare data for Claude (top 20 videos)
+        video_data = _video_table(videos)
         
-        prompt = f"""Analyze these {len(video_data)} trending TikTok videos for topic trends:
-
-VIDEO DATA:
-{json.dumps(video_data, indent=2)}
-
-Provide analysis on:
-
-1. **TRENDING TOPICS**: What topics are gaining momentum?
-2. **HASHTAG TRENDS**: Which hashtags are performing best?
-3. **CONTENT PATTERNS**: What content types are viral?
-4. **THUMBNAIL TEXT INSIGHTS**: What do thumbnails reveal about trends?
-5. **AUDIENCE BEHAVIOR**: What's resonating with viewers?
-
-Return structured insights with specific examples and data."""
+        prompt = f"""VIDEO DATA ({len(video_data['rows'])} videos, one row per video in schema order):
+{prompt_json(video_data)}"""
 
         try:
-            print(f"🎯 [LLM-ANALYZER] Starting trending topics analysis for {len(video_data)} videos...")
-            result = await self.claude.analyze(prompt, max_tokens=2000)
+            print(f"🎯 [LLM-ANALYZER] Starting trending topics analysis for {len(video_data['rows'])} videos...")
+            result = await self._analyze(prompt, system=_TRENDING_SYSTEM, max_tokens=2000)
             
             if result["success"]:
                 print(f"✅ [LLM-ANALYZER] Trending analysis completed successfully!")
@@ -82,31 +169,19 @@ Return structured insights with specific examples and data."""
         """Analyze hashtag momentum and growth patterns"""
         self._ensure_claude_initialized()
         
-        prompt = f"""Analyze hashtag momentum from this data:
-
-HASHTAG DATA:
-{json.dumps(hashtag_data, indent=2)}
-
-Provide insights on:
-
-1. **MOMENTUM PATTERNS**: Which hashtags are growing fastest?
-2. **USAGE TRENDS**: How are successful hashtags being used?
-3. **COMBINATION STRATEGIES**: Which hashtag combos work best?
-4. **TIMING INSIGHTS**: When do these hashtags perform best?
-5. **PREDICTIONS**: Which hashtags will likely trend next?
-
-Focus on actionable insights for content creators."""
+        prompt = f"""HASHTAG DATA:
+{prompt_json(hashtag_data)}"""
 
         try:
             print(f"📊 [LLM-ANALYZER] Starting hashtag momentum analysis...")
             # 🚨 CLAUDE API CALL LOGGING 🚨
-            print("🧠 [LLM] Sending creator analysis request to Claude Opus 4...")
-            print(f"👤 [LLM] Analyzing creator: {creator_name}")
+            print("🧠 [LLM] Sending hashtag momentum request to Claude Opus 4...")
+            print(f"#️⃣ [LLM] Analyzing hashtags: {len(hashtag_data)}")
             print("⏱️ [LLM] Request processing...")
             
-            result = await self.claude.analyze(prompt, max_tokens=1500)
+            result = await self._analyze(prompt, system=_HASHTAG_SYSTEM, max_tokens=1500)
             
-            print("✅ [LLM] Claude creator analysis completed!")
+            print("✅ [LLM] Claude hashtag analysis completed!")
             print("=" * 50)
             
             if result["success"]:
@@ -124,6 +199,13 @@ Focus on actionable insights for content creators."""
             print(f"💥 [LLM-ANALYZER] Exception in hashtag analysis: {str(e)}")
             return {'error': f'Hashtag analysis failed: {str(e)}'}
     
+    @staticmethod
+    def _transcript_table(transcripts: List[Dict]) -> Dict[str, Any]:
+        """Columnar transcript payload matching TRANSCRIPT_SCHEMA"""
+        return {"schema": TRANSCRIPT_SCHEMA, "rows": [
+            [t['transcript'], t['author'], t['views'], t['hashtags']] for t in transcripts
+        ]}
+    
     async def analyze_emerging_topics(self, recent_videos: List[Dict], comparison_videos: List[Dict], hashtags: List[str]) -> Dict[str, Any]:
         """Analyze emerging topics by comparing recent vs comparison video transcripts"""
         self._ensure_claude_initialized()
@@ -161,6 +243,14 @@ Focus on actionable insights for content creators."""
                 'error': f'Insufficient transcript data. Recent: {len(recent_transcripts)}, Comparison: {len(comparison_transcripts)}'
             }
         
+        # Identical inputs (e.g. a re-run) reuse the earlier analysis instead of another 2500-token call
+        inputs_key = hashlib.blake2b(
+            prompt_json([recent_transcripts, comparison_transcripts, list(hashtags)]).encode(), digest_size=16
+        ).hexdigest()
+        if inputs_key in self._emerging_results:
+            print(f"🗃️ [LLM-ANALYZER] Transcripts unchanged, reusing the previous emerging topics analysis")
+            return {**self._emerging_results[inputs_key], 'cost': 0, 'response_time': 0}
+        
         # Prepare data for Claude
         analysis_data = {
             'hashtags_analyzed': hashtags,
@@ -174,31 +264,15 @@ Focus on actionable insights for content creators."""
             }
         }
         
-        prompt = f"""Analyze these TikTok transcripts to identify EMERGING TOPICS and trends:
-
-HASHTAGS BEING ANALYZED: {', '.join(hashtags)}
+        prompt = f"""Transcripts are given as a schema and one row per video in schema order.
 
 RECENT PERIOD TRANSCRIPTS ({len(recent_transcripts)} total):
-{json.dumps(analysis_data['recent_period']['transcripts'], indent=2)}
-
-COMPARISON PERIOD TRANSCRIPTS ({len(comparison_transcripts)} total):  
-{json.dumps(analysis_data['comparison_period']['transcripts'], indent=2)}
-
-Please provide analysis on:
-
-1. **EMERGING TOPICS**: What NEW subjects/themes appear in recent transcripts but NOT in comparison transcripts?
-
-2. **TOPIC EVOLUTION**: How have existing topics changed or evolved between the two periods?
-
-3. **LANGUAGE PATTERNS**: What new phrases, terminology, or speaking patterns are emerging?
-
-4. **CONTENT SHIFTS**: What shifts in content focus or messaging do you detect?
-
-5. **TREND PREDICTIONS**: Based on these emerging patterns, what trends might develop next?
+{prompt_json(self._transcript_table(analysis_data['recent_period']['transcripts']))}
 
-6. **HASHTAG RELEVANCE**: How do these emerging topics relate to the target hashtags: {', '.join(hashtags)}?
+COMPARISON PERIOD TRANSCRIPTS ({len(comparison_transcripts)} total):
+{prompt_json(self._transcript_table(analysis_data['comparison_period']['transcripts']))}
 
-Focus on actionable insights about genuine emerging trends vs temporary variations."""
+HASHTAGS BEING ANALYZED: {', '.join(hashtags)}"""
 
         try:
             print(f"🤖 [LLM-ANALYZER] Sending emerging topics analysis to Claude...")
@@ -209,14 +283,14 @@ Focus on actionable insights about genuine emerging trends vs temporary variatio
             print(f"📝 [LLM] Total content being analyzed: {len(recent_videos) + len(comparison_videos)} video transcripts")
             print("⏱️ [LLM] Request processing...")
             
-            result = await self.claude.analyze(prompt, max_tokens=2500)
+            result = await self._analyze(prompt, system=_EMERGING_SYSTEM, max_tokens=2500)
             
             print("✅ [LLM] Claude emerging topics analysis completed!")
             print("=" * 50)
             
             if result["success"]:
                 print(f"✅ [LLM-ANALYZER] Emerging topics analysis completed successfully!")
-                return {
+                analysis = {
                     'success': True,
                     'analysis': result["response"],
                     'cost': result.get('cost', 0),
@@ -228,6 +302,10 @@ Focus on actionable insights about genuine emerging trends vs temporary variatio
                         'hashtags': hashtags
                     }
                 }
+                if len(self._emerging_results) >= 256:
+                    self._emerging_results.pop(next(iter(self._emerging_results)))
+                self._emerging_results[inputs_key] = analysis
+                return analysis
             else:
                 print(f"❌ [LLM-ANALYZER] Emerging topics analysis failed: {result.get('error', 'Unknown error')}")
                 return {
@@ -245,23 +323,11 @@ Focus on actionable insights about genuine emerging trends vs temporary variatio
     async def generate_content_recommendations(self, analysis_data: Dict) -> Dict[str, Any]:
         """Generate content creation recommendations"""
         
-        prompt = f"""Based on this trending analysis, create specific content recommendations:
-
-ANALYSIS DATA:
-{json.dumps(analysis_data, indent=2)}
-
-Generate:
-
-1. **5 SPECIFIC VIDEO IDEAS** that would likely go viral
-2. **OPTIMAL HASHTAG COMBOS** for each video idea  
-3. **THUMBNAIL TEXT SUGGESTIONS** based on successful patterns
-4. **POSTING TIMING** recommendations
-5. **CONTENT HOOKS** that are currently working
-
-Make recommendations specific and actionable."""
+        prompt = f"""ANALYSIS DATA:
+{prompt_json(analysis_data)}"""
 
         try:
-            result = await self.claude.analyze(prompt, max_tokens=2000)
+            result = await self._analyze(prompt, system=_RECOMMENDATIONS_SYSTEM, max_tokens=2000)
             
             if result["success"]:
                 return {
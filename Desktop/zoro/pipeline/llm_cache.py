@@ -0,0 +1,116 @@
+"""
+LLM Response Cache
+==================
+
+Reuses Claude responses for repeated and near-duplicate prompts.
+Exact prompt hashes are always checked; embedding similarity is opt-in via
+LLM_CACHE_SIMILARITY and needs sentence-transformers.
+"""
+
+import asyncio
+import functools
+import hashlib
+import logging
+import os
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+# Embeddings are optional; without them only exact prompt matches hit the cache
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    EMBEDDINGS_AVAILABLE = True
+except ImportError:
+    EMBEDDINGS_AVAILABLE = False
+
+logger = logging.getLogger("zoro.llm_cache")
+
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# MiniLM truncates input at 256 tokens, so prompts are embedded in chunks that each fit
+EMBEDDING_CHUNK_CHARS = 500
+
+class SemanticCache:
+    """Two-tier cache of successful LLM results: exact prompt hash, then cosine similarity"""
+
+    def __init__(self, threshold: float = 0.93, max_entries: int = 512, use_embeddings: bool = False):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.use_embeddings = use_embeddings and EMBEDDINGS_AVAILABLE
+        self._model = None
+        self._day = date.today()
+        self._exact: Dict[str, Dict[str, Any]] = {}
+        # Semantic tier: parallel lists of (call options, per-chunk normalized embeddings, result)
+        self._options: List[str] = []
+        self._vectors: List[Any] = []
+        self._results: List[Dict[str, Any]] = []
+
+    def _roll_day(self):
+        """Trending answers go stale, so everything is dropped when the date changes"""
+        today = date.today()
+        if today != self._day:
+            self._day = today
+            self._exact.clear()
+            self._options.clear()
+            self._vectors.clear()
+            self._results.clear()
+
+    def _embed(self, prompt: str):
+        if self._model is None:
+            self._model = SentenceTransformer(EMBEDDING_MODEL)
+        chunks = [prompt[i:i + EMBEDDING_CHUNK_CHARS] for i in range(0, len(prompt), EMBEDDING_CHUNK_CHARS)]
+        return self._model.encode(chunks, normalize_embeddings=True)
+
+    def _semantic_lookup(self, options: str, vectors) -> Optional[Dict[str, Any]]:
+        """Best cached result whose every chunk is similar to the matching chunk of this prompt"""
+        best_score, best = self.threshold, None
+        for cached_options, cached_vectors, result in zip(self._options, self._vectors, self._results):
+            if cached_options != options or cached_vectors.shape != vectors.shape:
+                continue
+            score = float(np.min(np.sum(cached_vectors * vectors, axis=1)))
+            if score >= best_score:
+                best_score, best = score, result
+        return best
+
+    async def analyze(self, llm, prompt: str, *, semantic: bool = True, **kwargs) -> Dict[str, Any]:
+        """Return a cached result for prompt, or call llm.analyze; semantic=False allows exact matches only"""
+        self._roll_day()
+        options = repr(sorted(kwargs.items()))
+        key = hashlib.blake2b(f"{options}\n{prompt}".encode(), digest_size=16).hexdigest()
+
+        cached = self._exact.get(key)
+        vector = None
+        if cached is None and semantic and self.use_embeddings:
+            vector = await asyncio.to_thread(self._embed, prompt)
+            cached = self._semantic_lookup(options, vector)
+
+        if cached is not None:
+            logger.debug("🗃️ [LLM-CACHE] Hit for prompt %s...", prompt[:60])
+            return {**cached, 'cost': 0.0, 'response_time': 0.0, 'cached': True}
+
+        result = await llm.analyze(prompt, **kwargs)
+        if not result.get("success"):
+            return result
+
+        if len(self._exact) >= self.max_entries:
+            self._exact.pop(next(iter(self._exact)))
+        self._exact[key] = result
+
+        if vector is not None:
+            if len(self._results) >= self.max_entries:
+                del self._options[0], self._vectors[0], self._results[0]
+            self._options.append(options)
+            self._vectors.append(vector)
+            self._results.append(result)
+        return result
+
+@functools.lru_cache(maxsize=1)
+def get_llm_cache() -> Optional[SemanticCache]:
+    """Process-wide LLM cache; LLM_CACHE=0 disables it, LLM_CACHE_SIMILARITY=<threshold> enables the semantic tier"""
+    if os.getenv("LLM_CACHE", "1") == "0":
+        return None
+    # Embeddings barely move when only the numbers in a prompt change, so similarity matching is opt-in
+    similarity = os.getenv("LLM_CACHE_SIMILARITY")
+    if not similarity:
+        return SemanticCache()
+    return SemanticCache(threshold=float(similarity), use_embeddings=True)
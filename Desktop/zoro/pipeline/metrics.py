@@ -6,197 +6,266 @@ Calculates engagement rates, viral scores, and growth metrics.
 Enhanced with LLM analysis for semantic metrics.
 """
 
+import json
+import re
 import sys
 import os
+import logging
 from typing import Dict, List
-from collections import Counter, defaultdict
+from collections import Counter
 from datetime import datetime, timedelta
 
+import numpy as np
+
 # Add parent directory for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
-    from ai.claude_primary_system import ClaudePrimarySystem
+    from ai.claude_primary_system import get_ai_system
+    from pipeline.llm_cache import get_llm_cache
+    from pipeline.llm_analyzer import prompt_json
     LLM_AVAILABLE = True
 except ImportError:
     LLM_AVAILABLE = False
     print("⚠️ LLM system not available for enhanced metrics")
 
+logger = logging.getLogger("zoro.metrics")
+
+# Numeric fields (with defaults) read by the aggregate trending metrics
+TRENDING_FIELDS = {
+    'views': 0,
+    'total_engagement': 0,
+    'engagement_rate': 0,
+    'viral_score': 0,
+    'hook_strength': 5,
+    'viral_pattern_score': 5,
+    'trending_potential': 5
+}
+
+# Numeric fields (with defaults) summed per hashtag
+HASHTAG_FIELDS = {
+    'views': 0,
+    'total_engagement': 0,
+    'viral_pattern_score': 5,
+    'trending_potential': 5
+}
+
+# Raw counters read by the per-video engagement metrics
+ENGAGEMENT_FIELDS = {
+    'views': 0,
+    'likes': 0,
+    'comments': 0,
+    'shares': 0
+}
+
+# Videos (from the top of the list) sent to Claude for semantic metrics
+LLM_METRICS_TOP_N = 10
+
+# Semantic metrics used when Claude is unavailable or a video is missing from the reply
+DEFAULT_LLM_METRICS = {
+    'hook_strength': 5,
+    'viral_pattern_score': 5,
+    'content_category': 'unknown',
+    'click_bait_score': 5,
+    'thumbnail_effectiveness': 5,
+    'trending_potential': 5,
+    'llm_cost': 0
+}
+
+# Static instructions for the batched semantic metrics, sent as a cacheable system prompt
+_LLM_METRICS_SYSTEM = """You analyze TikTok videos for viral patterns. The user message lists the VIDEOS, one JSON object per line.
+
+Provide ONLY a JSON array with exactly one object per video, in the same order, each with these metrics:
+{
+    "idx": <the video's idx>,
+    "hook_strength": 0-10,
+    "viral_pattern_score": 0-10,
+    "content_category": "business|lifestyle|educational|entertainment|other",
+    "click_bait_score": 0-10,
+    "thumbnail_effectiveness": 0-10,
+    "trending_potential": 0-10
+}
+
+Focus on: hook strength, viral patterns, thumbnail text impact, and trending potential."""
+
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+
+# Viral score weights: comments are more valuable, shares are most valuable
+LIKE_WEIGHT = 1.0
+COMMENT_WEIGHT = 3.0
+SHARE_WEIGHT = 5.0
+
 class MetricsCalculator:
     """Handles all metrics calculations with LLM enhancement"""
     
-    def __init__(self):
-        self.llm = ClaudePrimarySystem() if LLM_AVAILABLE else None
+    @property
+    def llm(self):
+        """Shared Claude system, resolved on each use so metrics-only callers never build one"""
+        return get_ai_system() if LLM_AVAILABLE else None
+    
+    @staticmethod
+    def to_columnar(videos: List[Dict], fields: Dict[str, float]) -> Dict[str, np.ndarray]:
+        """Convert per-video dicts into one NumPy column per field (missing values use the default)"""
+        n = len(videos)
+        return {
+            field: np.fromiter((v.get(field, default) for v in videos), dtype=np.float64, count=n)
+            for field, default in fields.items()
+        }
         
-    def calculate_engagement_metrics(self, videos: List[Dict]) -> List[Dict]:
+    async def calculate_engagement_metrics(self, videos: List[Dict]) -> List[Dict]:
         """Calculate engagement metrics for videos with LLM enhancement"""
         
         print("📊 Calculating enhanced metrics with Claude analysis...")
         
-        for i, video in enumerate(videos):
-            views = video.get('views', 0)
-            likes = video.get('likes', 0)
-            comments = video.get('comments', 0)
-            shares = video.get('shares', 0)
-            
-            # Basic engagement metrics
-            total_engagement = likes + comments + shares
-            engagement_rate = (total_engagement / views * 100) if views > 0 else 0
-            
-            # Viral score (weighted engagement)
-            like_weight = 1.0
-            comment_weight = 3.0  # Comments are more valuable
-            share_weight = 5.0    # Shares are most valuable
-            
-            weighted_engagement = (likes * like_weight + 
-                                 comments * comment_weight + 
-                                 shares * share_weight)
-            
-            viral_score = min((weighted_engagement / views * 100), 100) if views > 0 else 0
-            
-            # Add basic metrics
-            video['engagement_rate'] = round(engagement_rate, 2)
-            video['viral_score'] = round(viral_score, 2)
-            video['total_engagement'] = total_engagement
-            
-            # LLM-Enhanced Semantic Metrics
-            if self.llm and i < 10:  # Analyze top 10 videos for performance
-                semantic_metrics = self._calculate_llm_metrics(video)
+        # Basic engagement metrics for the whole batch at once
+        cols = self.to_columnar(videos, ENGAGEMENT_FIELDS)
+        views, likes, comments, shares = cols['views'], cols['likes'], cols['comments'], cols['shares']
+        has_views = views > 0
+        
+        total_engagement = likes + comments + shares
+        engagement_rates = np.divide(total_engagement, views, out=np.zeros_like(views), where=has_views) * 100
+        
+        # Viral score (weighted engagement), capped at 100
+        weighted_engagement = likes * LIKE_WEIGHT + comments * COMMENT_WEIGHT + shares * SHARE_WEIGHT
+        viral_scores = np.minimum(
+            np.divide(weighted_engagement * 100, views, out=np.zeros_like(views), where=has_views), 100
+        )
+        
+        # Scatter the basic metrics back onto the videos in one update per video
+        for video, engagement_rate, viral_score, engagement in zip(
+                videos, np.round(engagement_rates, 2).tolist(), np.round(viral_scores, 2).tolist(),
+                total_engagement.astype(np.int64).tolist()):
+            video.update(engagement_rate=engagement_rate, viral_score=viral_score, total_engagement=engagement)
+        logger.debug("   Processed %d videos", len(videos))
+        
+        # LLM-Enhanced Semantic Metrics: one Claude request for the top videos
+        top_videos = videos[:LLM_METRICS_TOP_N]
+        if top_videos and self.llm:
+            for video, semantic_metrics in zip(top_videos, await self._calculate_llm_metrics_batch(top_videos)):
                 video.update(semantic_metrics)
-            
-            if (i + 1) % 20 == 0:
-                print(f"   Processed {i + 1}/{len(videos)} videos...")
         
         return videos
     
-    def _calculate_llm_metrics(self, video: Dict) -> Dict:
-        """Calculate LLM-enhanced semantic metrics"""
+    async def _calculate_llm_metrics_batch(self, videos: List[Dict]) -> List[Dict]:
+        """Calculate LLM-enhanced semantic metrics for several videos in a single Claude request"""
+        
+        n = len(videos)
+        items = [{
+            'idx': idx,
+            'description': video.get('text', '')[:200],
+            'thumbnail_text': video.get('ocr_text', ''),
+            'author': video.get('author', ''),
+            'views': video.get('views', 0),
+            'engagement_rate': video.get('engagement_rate', 0)
+        } for idx, video in enumerate(videos)]
         
+        prompt = f"VIDEOS ({n} total):\n{prompt_json(items)}"
+        
+        results = [dict(DEFAULT_LLM_METRICS) for _ in videos]
         try:
-            # Prepare content for analysis
-            description = video.get('text', '')
-            ocr_text = video.get('ocr_text', '')
-            author = video.get('author', '')
-            engagement_rate = video.get('engagement_rate', 0)
-            views = video.get('views', 0)
+            cache = get_llm_cache()
+            if cache is None:
+                result = await self.llm.analyze(prompt, system=_LLM_METRICS_SYSTEM, max_tokens=200 * n)
+            else:
+                # Per-video scores are mapped back by idx, so only an exact prompt match may be reused
+                result = await cache.analyze(self.llm, prompt, semantic=False,
+                                             system=_LLM_METRICS_SYSTEM, max_tokens=200 * n)
+            if not result.get("success"):
+                return results
             
-            # Quick LLM analysis prompt
-            prompt = f"""Analyze this TikTok video content for viral patterns:
-
-DESCRIPTION: {description[:200]}
-THUMBNAIL TEXT: {ocr_text}
-AUTHOR: @{author}
-VIEWS: {views:,}
-ENGAGEMENT: {engagement_rate}%
-
-Provide ONLY a JSON response with these metrics:
-{{
-    "hook_strength": 0-10,
-    "viral_pattern_score": 0-10,
-    "content_category": "business|lifestyle|educational|entertainment|other",
-    "click_bait_score": 0-10,
-    "thumbnail_effectiveness": 0-10,
-    "trending_potential": 0-10
-}}
-
-Focus on: hook strength, viral patterns, thumbnail text impact, and trending potential."""
-
-            # Get LLM analysis (use sync version for speed)
-            import asyncio
-            try:
-                result = asyncio.run(self.llm.analyze(prompt, max_tokens=200))
-                
-                if result.get("success"):
-                    response = result["response"].strip()
-                    # Extract JSON from response
-                    import json
-                    import re
-                    
-                    # Find JSON in response
-                    json_match = re.search(r'\{.*\}', response, re.DOTALL)
-                    if json_match:
-                        metrics_data = json.loads(json_match.group())
-                        
-                        return {
-                            'hook_strength': metrics_data.get('hook_strength', 5),
-                            'viral_pattern_score': metrics_data.get('viral_pattern_score', 5),
-                            'content_category': metrics_data.get('content_category', 'other'),
-                            'click_bait_score': metrics_data.get('click_bait_score', 5),
-                            'thumbnail_effectiveness': metrics_data.get('thumbnail_effectiveness', 5),
-                            'trending_potential': metrics_data.get('trending_potential', 5),
-                            'llm_cost': result.get('cost', 0)
-                        }
-                
-            except Exception as e:
-                print(f"   ⚠️ LLM analysis failed for video: {str(e)[:50]}")
-                
+            json_match = _JSON_ARRAY_RE.search(result["response"])
+            if not json_match:
+                return results
+            
+            # The request cost is shared evenly so summed llm_cost still matches the bill
+            cost_share = result.get('cost', 0) / n
+            for position, metrics_data in enumerate(json.loads(json_match.group())):
+                if not isinstance(metrics_data, dict):
+                    continue
+                idx = metrics_data.get('idx', position)
+                if not isinstance(idx, int) or not 0 <= idx < n:
+                    continue
+                results[idx] = {
+                    'hook_strength': metrics_data.get('hook_strength', 5),
+                    'viral_pattern_score': metrics_data.get('viral_pattern_score', 5),
+                    'content_category': metrics_data.get('content_category', 'other'),
+                    'click_bait_score': metrics_data.get('click_bait_score', 5),
+                    'thumbnail_effectiveness': metrics_data.get('thumbnail_effectiveness', 5),
+                    'trending_potential': metrics_data.get('trending_potential', 5),
+                    'llm_cost': cost_share
+                }
+        
         except Exception as e:
-            print(f"   ⚠️ Metrics calculation failed: {str(e)[:50]}")
+            print(f"   ⚠️ LLM analysis failed for batch: {str(e)[:50]}")
         
-        # Return default metrics if LLM fails
-        return {
-            'hook_strength': 5,
-            'viral_pattern_score': 5,
-            'content_category': 'unknown',
-            'click_bait_score': 5,
-            'thumbnail_effectiveness': 5,
-            'trending_potential': 5,
-            'llm_cost': 0
-        }
+        return results
     
     def calculate_hashtag_metrics(self, videos: List[Dict]) -> Dict[str, Dict]:
         """Calculate hashtag performance metrics with LLM insights"""
         
-        hashtag_data = defaultdict(lambda: {
-            'count': 0,
-            'total_views': 0,
-            'total_engagement': 0,
-            'avg_engagement_rate': 0,
-            'top_creators': [],
-            'viral_pattern_scores': [],
-            'trending_potentials': []
-        })
-        
-        # Collect hashtag data
-        for video in videos:
-            hashtags = video.get('hashtags', [])
-            views = video.get('views', 0)
-            engagement = video.get('total_engagement', 0)
-            engagement_rate = video.get('engagement_rate', 0)
+        # Explode into one (video, hashtag) row per tag; hashtags get dense ids in first-seen order
+        hashtag_ids: Dict[str, int] = {}
+        stats: List[Dict] = []
+        row_videos: List[int] = []
+        row_tags: List[int] = []
+        for i, video in enumerate(videos):
             author = video.get('author', '')
-            
-            # LLM metrics
-            viral_pattern = video.get('viral_pattern_score', 5)
-            trending_potential = video.get('trending_potential', 5)
-            
-            for hashtag in hashtags:
-                data = hashtag_data[hashtag]
-                data['count'] += 1
-                data['total_views'] += views
-                data['total_engagement'] += engagement
-                data['viral_pattern_scores'].append(viral_pattern)
-                data['trending_potentials'].append(trending_potential)
-                
-                if author not in data['top_creators']:
-                    data['top_creators'].append(author)
-        
-        # Calculate averages and add LLM insights
-        for hashtag, data in hashtag_data.items():
-            if data['count'] > 0:
-                data['avg_views'] = data['total_views'] / data['count']
-                data['avg_engagement_rate'] = data['total_engagement'] / data['total_views'] * 100 if data['total_views'] > 0 else 0
-                data['avg_viral_pattern'] = sum(data['viral_pattern_scores']) / len(data['viral_pattern_scores'])
-                data['avg_trending_potential'] = sum(data['trending_potentials']) / len(data['trending_potentials'])
-                
-                # Momentum score (combines traditional + LLM metrics)
-                momentum_score = (
-                    data['avg_engagement_rate'] * 0.3 +
-                    data['avg_viral_pattern'] * 0.4 +
-                    data['avg_trending_potential'] * 0.3
-                )
-                data['momentum_score'] = round(momentum_score, 2)
-        
-        return dict(hashtag_data)
+            for hashtag in video.get('hashtags', []):
+                tag_id = hashtag_ids.setdefault(hashtag, len(stats))
+                if tag_id == len(stats):
+                    # Insertion-ordered set: O(1) de-duplication, first-seen creator order kept
+                    stats.append({'top_creators': {}})
+                row_videos.append(i)
+                row_tags.append(tag_id)
+                stats[tag_id]['top_creators'][author] = None
+        
+        if not stats:
+            return {}
+        
+        # Per-hashtag sums in one bincount pass per field
+        cols = self.to_columnar(videos, HASHTAG_FIELDS)
+        rows = np.array(row_videos, dtype=np.intp)
+        tags = np.array(row_tags, dtype=np.intp)
+        n = len(stats)
+        counts = np.bincount(tags, minlength=n)
+        sums = {field: np.bincount(tags, weights=col[rows], minlength=n) for field, col in cols.items()}
+        
+        total_views = sums['views']
+        avg_views = total_views / counts
+        avg_engagement_rate = np.divide(sums['total_engagement'], total_views,
+                                        out=np.zeros(n), where=total_views > 0) * 100
+        avg_viral_pattern = sums['viral_pattern_score'] / counts
+        avg_trending_potential = sums['trending_potential'] / counts
+        
+        # Momentum score (combines traditional + LLM metrics)
+        momentum_scores = (
+            avg_engagement_rate * 0.3 +
+            avg_viral_pattern * 0.4 +
+            avg_trending_potential * 0.3
+        )
+        
+        # Per-hashtag score lists: group the rows by hashtag and split at the count boundaries
+        order = np.argsort(tags, kind='stable')
+        bounds = np.cumsum(counts)[:-1]
+        pattern_groups = np.split(cols['viral_pattern_score'][rows[order]], bounds)
+        potential_groups = np.split(cols['trending_potential'][rows[order]], bounds)
+        
+        for i, data in enumerate(stats):
+            data.update(
+                top_creators=list(data['top_creators']),
+                count=int(counts[i]),
+                total_views=int(total_views[i]),
+                total_engagement=int(sums['total_engagement'][i]),
+                viral_pattern_scores=pattern_groups[i].tolist(),
+                trending_potentials=potential_groups[i].tolist(),
+                avg_views=float(avg_views[i]),
+                avg_engagement_rate=float(avg_engagement_rate[i]),
+                avg_viral_pattern=float(avg_viral_pattern[i]),
+                avg_trending_potential=float(avg_trending_potential[i]),
+                momentum_score=round(float(momentum_scores[i]), 2)
+            )
+        
+        return dict(zip(hashtag_ids, stats))
     
     def calculate_trending_metrics(self, videos: List[Dict]) -> Dict:
         """Calculate overall trending metrics with LLM insights"""
@@ -205,16 +274,18 @@ Focus on: hook strength, viral patterns, thumbnail text impact, and trending pot
             return {}
         
         total_videos = len(videos)
-        total_views = sum(v.get('views', 0) for v in videos)
-        total_engagement = sum(v.get('total_engagement', 0) for v in videos)
+        cols = self.to_columnar(videos, TRENDING_FIELDS)
+        
+        total_views = int(cols['views'].sum())
+        total_engagement = int(cols['total_engagement'].sum())
         
-        avg_engagement_rate = sum(v.get('engagement_rate', 0) for v in videos) / total_videos
-        avg_viral_score = sum(v.get('viral_score', 0) for v in videos) / total_videos
+        avg_engagement_rate = float(cols['engagement_rate'].mean())
+        avg_viral_score = float(cols['viral_score'].mean())
         
         # LLM-enhanced metrics
-        avg_hook_strength = sum(v.get('hook_strength', 5) for v in videos) / total_videos
-        avg_viral_pattern = sum(v.get('viral_pattern_score', 5) for v in videos) / total_videos
-        avg_trending_potential = sum(v.get('trending_potential', 5) for v in videos) / total_videos
+        avg_hook_strength = float(cols['hook_strength'].mean())
+        avg_viral_pattern = float(cols['viral_pattern_score'].mean())
+        avg_trending_potential = float(cols['trending_potential'].mean())
         
         # Content category distribution
         categories = [v.get('content_category', 'unknown') for v in videos]
@@ -240,5 +311,5 @@ Focus on: hook strength, viral patterns, thumbnail text impact, and trending pot
             'avg_trending_potential': round(avg_trending_potential, 2),
             'trending_momentum': round(trending_momentum, 2),
             'category_distribution': category_distribution,
-            'top_performing_video': max(videos, key=lambda x: x.get('viral_score', 0)) if videos else None
+            'top_performing_video': videos[int(np.argmax(cols['viral_score']))]
         } 
\ No newline at end of file
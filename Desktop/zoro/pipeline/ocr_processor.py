@@ -5,17 +5,122 @@ OCR Processing Component
 Handles thumbnail text extraction using Tesseract OCR.
 """
 
+import functools
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 from PIL import Image
 from io import BytesIO
-import pytesseract
 from typing import Dict, Optional
 
+# tesserocr runs libtesseract in-process; pytesseract spawns the tesseract CLI per image
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    import pytesseract
+    TESSEROCR_AVAILABLE = False
+
+logger = logging.getLogger("zoro.ocr")
+
+# Common OCR mistakes: pipes read for capital I, zeros for capital O
+_OCR_FIXES = str.maketrans({'|': 'I', '0': 'O'})
+
+# Cached OCR results older than this are ignored and purged
+OCR_CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+# Thumbnails whose pixels change under a stable URL (e.g. LIVE covers) are never cached
+_OCR_CACHE_SKIP = re.compile(r"webcast|/live/", re.IGNORECASE)
+
+class OCRCache:
+    """SQLite cache of OCR results keyed by a hash of the thumbnail URL or image bytes"""
+    
+    def __init__(self, path: str = "ocr_cache.db", ttl: int = OCR_CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        # The connection is shared by the OCR worker threads
+        self._lock = threading.Lock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS ocr_cache (key TEXT PRIMARY KEY, ts INTEGER, text TEXT, confidence TEXT)"
+        )
+        self.conn.execute("DELETE FROM ocr_cache WHERE ts < ?", (int(time.time()) - self.ttl,))
+    
+    @staticmethod
+    def key_for(url: str) -> Optional[str]:
+        """Cache key for a thumbnail URL, or None if it should not be cached"""
+        if _OCR_CACHE_SKIP.search(url):
+            return None
+        # CDN query strings carry expiring signatures; the path identifies the image
+        return hashlib.blake2b(url.split('?', 1)[0].encode(), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def key_for_content(content: bytes) -> str:
+        """Cache key for downloaded image bytes, catching the same image under a new URL"""
+        return "img:" + hashlib.blake2b(content, digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """Return cached OCR fields for key, or None"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT text, confidence FROM ocr_cache WHERE key = ? AND ts >= ?",
+                (key, int(time.time()) - self.ttl)
+            ).fetchone()
+        return {'ocr_text': row[0], 'ocr_confidence': row[1]} if row else None
+    
+    def set(self, key: str, fields: Dict[str, str]):
+        """Store OCR fields under key"""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO ocr_cache (key, ts, text, confidence) VALUES (?, ?, ?, ?)",
+                (key, int(time.time()), fields['ocr_text'], fields['ocr_confidence'])
+            )
+
+# Longest thumbnail edge handed to Tesseract; OCR cost grows with pixel count
+OCR_MAX_EDGE = 720
+_RESAMPLE_BILINEAR = getattr(Image, "Resampling", Image).BILINEAR
+
+# Sized for the thread pool in process_videos_batch
+OCR_THREAD_WORKERS = 16
+
+@functools.lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """Shared HTTP session so thumbnail downloads reuse pooled connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# PyTessBaseAPI is not thread-safe, so each OCR thread keeps its own loaded instance
+_tess_local = threading.local()
+
+def _image_to_text(image: Image.Image) -> str:
+    """Run Tesseract on an image, in-process when tesserocr is installed"""
+    if not TESSEROCR_AVAILABLE:
+        return pytesseract.image_to_string(image)
+    api = getattr(_tess_local, "api", None)
+    if api is None:
+        # Thumbnails carry scattered overlay text rather than paragraphs
+        api = _tess_local.api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SPARSE_TEXT)
+    api.SetImage(image)
+    return api.GetUTF8Text()
+
 class OCRProcessor:
     """Handles OCR text extraction from thumbnails"""
     
     def __init__(self):
         self.timeout = 15
+        # Persistent OCR cache; OCR_CACHE_PATH="" disables it
+        cache_path = os.getenv("OCR_CACHE_PATH", "ocr_cache.db")
+        self.cache = OCRCache(cache_path) if cache_path else None
         
     def extract_thumbnail_text(self, thumbnail_url: str) -> Optional[Dict[str, str]]:
         """Extract text from thumbnail image"""
@@ -25,22 +130,42 @@ class OCRProcessor:
             
         try:
             # Download thumbnail
-            response = requests.get(thumbnail_url, timeout=self.timeout)
+            response = _http_session().get(thumbnail_url, timeout=self.timeout)
             response.raise_for_status()
             
-            # Load image
+            # The same image often comes back under a different CDN URL
+            content_key = self.cache.key_for_content(response.content) if self.cache else None
+            if content_key:
+                cached = self.cache.get(content_key)
+                if cached:
+                    return {
+                        'raw_text': cached['ocr_text'],
+                        'cleaned_text': cached['ocr_text'],
+                        'confidence': cached['ocr_confidence']
+                    }
+            
+            # Load image; JPEG draft mode decodes straight to a reduced grayscale image
             image = Image.open(BytesIO(response.content))
+            image.draft('L', (OCR_MAX_EDGE, OCR_MAX_EDGE))
+            if max(image.size) > OCR_MAX_EDGE:
+                image.thumbnail((OCR_MAX_EDGE, OCR_MAX_EDGE), _RESAMPLE_BILINEAR)
+            # Grayscale roughly halves Tesseract's work
+            image = image.convert('L')
             
             # Extract text with OCR
-            raw_text = pytesseract.image_to_string(image)
+            raw_text = _image_to_text(image)
             
             # Clean text
             cleaned_text = self._clean_ocr_text(raw_text)
+            confidence = 'High' if cleaned_text.strip() else 'Low'
+            
+            if content_key:
+                self.cache.set(content_key, {'ocr_text': cleaned_text, 'ocr_confidence': confidence})
             
             return {
                 'raw_text': raw_text,
                 'cleaned_text': cleaned_text,
-                'confidence': 'High' if cleaned_text.strip() else 'Low'
+                'confidence': confidence
             }
             
         except Exception as e:
@@ -56,34 +181,64 @@ class OCRProcessor:
         if not text:
             return ""
         
-        lines = text.strip().split('\n')
-        cleaned_lines = []
+        # Drop single characters (which covers the lone |-_., artifacts) and digit-only lines,
+        # then fix common OCR mistakes in one translate pass
+        return ' '.join(
+            line for line in map(str.strip, text.strip().split('\n'))
+            if len(line) >= 2 and not line.isdigit()
+        ).translate(_OCR_FIXES)
+    
+    def _url_key(self, video: dict) -> Optional[str]:
+        thumbnail_url = video.get('thumbnail_url', '')
+        return self.cache.key_for(thumbnail_url) if self.cache and thumbnail_url else None
+    
+    def cached_fields(self, video: dict) -> Optional[Dict[str, str]]:
+        """Cached OCR fields for a video's thumbnail URL, or None"""
+        key = self._url_key(video)
+        return self.cache.get(key) if key else None
+    
+    def ocr_fields(self, video: dict) -> Dict[str, str]:
+        """OCR one video's thumbnail into the fields merged back onto the video"""
+        thumbnail_url = video.get('thumbnail_url', '')
+        key = self._url_key(video)
+        if key:
+            cached = self.cache.get(key)
+            if cached:
+                return cached
         
-        for line in lines:
-            line = line.strip()
-            if len(line) >= 2:  # Filter out single characters
-                # Filter out common OCR artifacts
-                if not line.isdigit() and not line in ['|', '-', '_', '.', ',']:
-                    # Fix common OCR mistakes
-                    line = line.replace('|', 'I')
-                    line = line.replace('0', 'O')
-                    cleaned_lines.append(line)
+        ocr_result = self.extract_thumbnail_text(thumbnail_url)
         
-        return ' '.join(cleaned_lines)
+        if ocr_result:
+            fields = {'ocr_text': ocr_result['cleaned_text'], 'ocr_confidence': ocr_result['confidence']}
+            # Failed downloads are retried next time rather than cached
+            if key and ocr_result['confidence'] != 'Failed':
+                self.cache.set(key, fields)
+            return fields
+        return {'ocr_text': 'No text found', 'ocr_confidence': 'Low'}
+    
+    def _process_one(self, video: dict) -> dict:
+        logger.debug("🔍 Processing OCR: @%s", video.get('author', 'unknown'))
+        video.update(self.ocr_fields(video))
+        return video
     
-    def process_videos_batch(self, videos: list) -> list:
-        """Process OCR for a batch of videos"""
+    def process_videos_batch(self, videos: list, max_workers: int = OCR_THREAD_WORKERS) -> list:
+        """Process OCR for a batch of videos, overlapping downloads and Tesseract calls in threads"""
         
-        for i, video in enumerate(videos):
-            print(f"🔍 Processing OCR {i+1}/{len(videos)}: @{video.get('author', 'unknown')}")
-            
-            ocr_result = self.extract_thumbnail_text(video.get('thumbnail_url', ''))
-            
-            if ocr_result:
-                video['ocr_text'] = ocr_result['cleaned_text']
-                video['ocr_confidence'] = ocr_result['confidence']
+        # Cache hits and thumbnail-less videos are settled here so only real downloads enter the pool
+        pending = []
+        for video in videos:
+            if not video.get('thumbnail_url'):
+                video.update({'ocr_text': 'No text found', 'ocr_confidence': 'Low'})
+                continue
+            cached = self.cached_fields(video)
+            if cached:
+                video.update(cached)
             else:
-                video['ocr_text'] = 'No text found'
-                video['ocr_confidence'] = 'Low'
+                pending.append(video)
+        
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+                list(executor.map(self._process_one, pending))
         
-        return videos 
\ No newline at end of file
+        print(f"🔍 Processed OCR for {len(videos)} videos")
+        return videos
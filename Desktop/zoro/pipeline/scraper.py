@@ -6,10 +6,13 @@ Handles all Apify scraping operations.
 """
 
 import os
+import re
 from typing import List, Dict, Any
 from apify_client import ApifyClient
 from datetime import datetime
 
+_HASHTAG_RE = re.compile(r'#(\w+)')
+
 class TikTokScraper:
     """Handles TikTok data scraping via Apify"""
     
@@ -77,31 +80,34 @@ class TikTokScraper:
         """Extract and normalize video data from Apify response"""
         
         try:
+            get = item.get
+            
             # Get thumbnail URL
             thumbnail_url = ""
-            video_meta = item.get('videoMeta', {})
+            video_meta = get('videoMeta', {})
             if video_meta.get('covers'):
                 thumbnail_url = video_meta['covers'][0]
             elif video_meta.get('coverUrl'):
                 thumbnail_url = video_meta['coverUrl']
             
+            text = get('text', '')
+            create_time = get('createTime')
             return {
-                'id': item.get('id', ''),
-                'text': item.get('text', ''),
-                'author': item.get('authorMeta', {}).get('name', 'unknown'),
-                'views': item.get('playCount', 0),
-                'likes': item.get('diggCount', 0),
-                'comments': item.get('commentCount', 0),
-                'shares': item.get('shareCount', 0),
-                'created_time': datetime.fromtimestamp(item.get('createTime', 0)) if item.get('createTime') else datetime.now(),
+                'id': get('id', ''),
+                'text': text,
+                'author': get('authorMeta', {}).get('name', 'unknown'),
+                'views': get('playCount', 0),
+                'likes': get('diggCount', 0),
+                'comments': get('commentCount', 0),
+                'shares': get('shareCount', 0),
+                'created_time': datetime.fromtimestamp(create_time) if create_time else datetime.now(),
                 'thumbnail_url': thumbnail_url,
-                'video_url': item.get('webVideoUrl', ''),
-                'hashtags': self._extract_hashtags(item.get('text', ''))
+                'video_url': get('webVideoUrl', ''),
+                'hashtags': self._extract_hashtags(text)
             }
         except Exception as e:
             return None
     
     def _extract_hashtags(self, text: str) -> List[str]:
         """Extract hashtags from text"""
-        import re
-        return re.findall(r'#(\w+)', text.lower()) 
\ No newline at end of file
+        return _HASHTAG_RE.findall(text.lower()) 
\ No newline at end of file
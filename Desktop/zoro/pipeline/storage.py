@@ -10,6 +10,16 @@ import os
 from datetime import datetime
 from typing import Dict, List, Any
 
+# orjson is optional; it is several times faster than the stdlib for large analyses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    # Keep datetimes/dataclasses going through default=str so output matches the json path
+    _ORJSON_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                       | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class DataStorage:
     """Handles data storage and retrieval"""
     
@@ -20,7 +30,9 @@ class DataStorage:
     def save_analysis(self, data: Dict[str, Any], analysis_type: str = "trending") -> str:
         """Save analysis results with timestamp"""
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # One clock read so the filename, timestamp and created_at agree
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         filename = f"{analysis_type}_analysis_{timestamp}.json"
         filepath = os.path.join(self.data_dir, filename)
         
@@ -28,12 +40,16 @@ class DataStorage:
         data['metadata'] = {
             'timestamp': timestamp,
             'analysis_type': analysis_type,
-            'created_at': datetime.now().isoformat()
+            'created_at': now.isoformat()
         }
         
         try:
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(data, default=str, option=_ORJSON_OPTIONS))
+            else:
+                with open(filepath, 'w') as f:
+                    json.dump(data, f, indent=2, default=str)
             
             print(f"💾 Analysis saved: {filepath}")
             return filepath
@@ -57,8 +73,12 @@ class DataStorage:
             latest_file = sorted(files)[-1]
             filepath = os.path.join(self.data_dir, latest_file)
             
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(filepath, 'r') as f:
+                    data = json.load(f)
             
             print(f"📂 Loaded analysis: {latest_file}")
             return data
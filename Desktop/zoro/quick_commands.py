@@ -11,17 +11,51 @@ Three core analysis types:
 """
 
 import asyncio
+import functools
+import logging
 import sys
 import os
-import subprocess
 import sqlite3
+import threading
 import json
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
+
+# orjson is optional; it serializes the saved analyses and hashtag columns much faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# uvloop is optional; a faster event loop for the concurrent scrapes and Claude calls
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from load_env import load_env_file
+from config.definitions import APIFY_MAX_CONCURRENT_RUNS
+
+logger = logging.getLogger("zoro.commands")
+
+def _dumps(data) -> str:
+    """Compact JSON string for DB columns"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+def _write_json(path: str, data):
+    """Write data to path as indented JSON"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
 
 def check_claude_availability():
     """Check if Claude is available with current API key"""
@@ -49,6 +83,131 @@ def initialize_environment():
     
     return anthropic_key, apify_token
 
+# ==================================================
+# SHARED ANALYZERS
+# ==================================================
+
+@functools.lru_cache(maxsize=1)
+def _llm_analyzer():
+    """Process-wide LLMAnalyzer so repeated flows reuse one Claude client"""
+    from pipeline.llm_analyzer import LLMAnalyzer
+    return LLMAnalyzer()
+
+@functools.lru_cache(maxsize=1)
+def _video_analyzer():
+    """Process-wide StandardVideoAnalyzer so repeated scrapes reuse one Apify client"""
+    from standard_video_analyzer import StandardVideoAnalyzer
+    return StandardVideoAnalyzer()
+
+# ==================================================
+# SHARED DATABASE CONNECTION
+# ==================================================
+
+DB_PATH = 'zoro_analysis.db'
+
+_CREATE_VIDEOS_SQL = '''
+    CREATE TABLE IF NOT EXISTS videos (
+        video_id TEXT PRIMARY KEY,
+        author TEXT,
+        description TEXT,
+        views INTEGER,
+        likes INTEGER,
+        comments INTEGER,
+        shares INTEGER,
+        engagement_rate REAL,
+        hashtags TEXT,
+        time_window TEXT,
+        analyzed_hashtags TEXT,
+        scraped_at TEXT
+    )
+'''
+
+_INSERT_VIDEO_SQL = '''
+    INSERT OR REPLACE INTO videos (
+        video_id, author, description, views, likes, comments, shares,
+        engagement_rate, hashtags, time_window, analyzed_hashtags, scraped_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+@functools.lru_cache(maxsize=1)
+def _get_db():
+    """Process-wide SQLite connection; schema is ensured once and statement plans are reused"""
+    conn = sqlite3.connect(DB_PATH, isolation_level=None, check_same_thread=False, cached_statements=200)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(_CREATE_VIDEOS_SQL)
+    return conn
+
+# ==================================================
+# DISPLAY HELPERS
+# ==================================================
+
+def _numbered(items, indent: str = "") -> str:
+    """Join items into a numbered block"""
+    return "\n".join(f"{indent}{i}. {item}" for i, item in enumerate(items, 1))
+
+# Static menus are rendered once at import and emitted with a single print
+_MAIN_MENU = "🎯 CHOOSE ANALYSIS TYPE:\n" + _numbered((
+    "Single Video Analysis",
+    "Creator Analysis",
+    "Emerging Topics Analysis (Hashtag Workflow)",
+    "🔥 Hashtag Combination Analysis (NEW)",
+)) + "\n"
+
+_HASHTAG_MENU = "\n🧠 HASHTAG ANALYSIS\n" + "=" * 40 + "\nChoose your action:\n" + _numbered((
+    "Scrape new videos (recent + past)",
+    "Analyze existing transcripts with Claude",
+    "View stored data summary",
+))
+
+_COMBINATION_INTRO = "\n🔥 HASHTAG COMBINATION ANALYSIS\n" + "=" * 50 + "\n📋 This will:\n" + _numbered((
+    "Find videos with ALL your hashtags (combination)",
+    "Scrape 50 recent videos (last 3 days)",
+    "Scrape 50 past videos (your chosen date)",
+    "Store all 100 videos",
+    "LLM reads ALL transcripts to find emerging topics",
+), indent="   ") + "\n"
+
+_ANALYSIS_SECTIONS = (
+    ('emerging_topics', "📈 EMERGING TOPICS:"),
+    ('language_patterns', "🗣️ LANGUAGE PATTERNS:"),
+    ('content_shifts', "📝 CONTENT EVOLUTION:"),
+)
+
+def _emit(text: str):
+    """Write a rendered block with one syscall on POSIX terminals, else via sys.stdout"""
+    if os.name == "posix":
+        encoding = sys.stdout.encoding or "utf-8"
+        data = b""
+        written = 0
+        try:
+            if sys.stdout.isatty():
+                sys.stdout.flush()  # keep ordering with earlier print() output
+                fd = sys.stdout.fileno()
+                data = text.encode(encoding)
+                while written < len(data):
+                    written += os.write(fd, memoryview(data)[written:])
+                return
+        except (AttributeError, OSError, ValueError):
+            pass  # captured/replaced stdout without a real fd
+        if written:
+            # Only the part the fd did not take goes through sys.stdout
+            text = data[written:].decode(encoding, errors="ignore")
+    sys.stdout.write(text)
+
+def _write_analysis_sections(title: str, width: int, analysis_result: dict):
+    """Render the analysis report into one buffer and emit it with a single write"""
+    lines = [f"\n{title}", "=" * width]
+    for key, heading in _ANALYSIS_SECTIONS:
+        items = analysis_result.get(key)
+        if not items:
+            continue
+        if len(lines) > 2:
+            lines.append("")
+        lines.append(heading)
+        lines.append(_numbered(items, indent="   "))
+    _emit("\n".join(lines) + "\n")
+
 # ==================================================
 # OPTION 1: SINGLE VIDEO ANALYSIS
 # ==================================================
@@ -95,12 +254,7 @@ async def creator_analysis():
 async def emerging_topics_analysis():
     """Hashtag scraping and analysis with manual control"""
     
-    print("\n🧠 HASHTAG ANALYSIS")
-    print("=" * 40)
-    print("Choose your action:")
-    print("1. Scrape new videos (recent + past)")
-    print("2. Analyze existing transcripts with Claude")
-    print("3. View stored data summary")
+    print(_HASHTAG_MENU)
     
     action = input("\nEnter choice (1/2/3): ").strip()
     
@@ -148,8 +302,7 @@ async def scrape_videos():
     print(f"   📅 Past: {start_date} to {end_date}")
     print(f"   🔗 Mode: {'COMBINATION (videos with ALL hashtags)' if use_combinations else 'SEPARATE (each hashtag individually)'}")
     
-    from standard_video_analyzer import StandardVideoAnalyzer
-    analyzer = StandardVideoAnalyzer()
+    analyzer = _video_analyzer()
     hashtag_list = [tag.strip().replace('#', '') for tag in hashtags.split(',')]
     
     if use_combinations:
@@ -160,6 +313,57 @@ async def scrape_videos():
     print(f"✅ Scraped and stored {len(all_videos)} total videos")
     print("📝 Run option 2 to analyze these transcripts with Claude")
 
+async def _scrape_all_hashtags(analyzer, hashtag_list, limit, status="   🔍 Scraping #{}..."):
+    """Scrape every hashtag concurrently, bounded by the Apify run limit; results keep input order"""
+    semaphore = asyncio.Semaphore(APIFY_MAX_CONCURRENT_RUNS)
+    # One status line for the whole phase rather than racing per-hashtag prints
+    print(status.format(", #".join(hashtag_list)))
+    
+    async def scrape(hashtag):
+        async with semaphore:
+            return await analyzer.scrape_hashtag_videos(hashtag, limit)
+    
+    return await asyncio.gather(*(scrape(hashtag) for hashtag in hashtag_list))
+
+# Videos uploaded within this many days count as the "recent" period
+RECENT_WINDOW_DAYS = 3
+
+def _split_time_windows(videos, start_date: str, end_date: str):
+    """Split scraped videos by upload date into the recent window and the past date range"""
+    recent_cutoff = datetime.now(timezone.utc) - timedelta(days=RECENT_WINDOW_DAYS)
+    try:
+        past_start, past_end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+    except ValueError:
+        print(f"⚠️ Invalid past date range {start_date} to {end_date}; using everything older than {RECENT_WINDOW_DAYS} days")
+        past_start, past_end = date.min, date.max
+    
+    recent, past = [], []
+    for video in videos:
+        created = video.created_at.astimezone(timezone.utc)
+        if created >= recent_cutoff:
+            recent.append(video)
+        elif past_start <= created.date() <= past_end:
+            past.append(video)
+    
+    skipped = len(videos) - len(recent) - len(past)
+    if skipped:
+        logger.info("   ⏭️ %d videos fall outside both periods and were not stored", skipped)
+    return recent, past
+
+def _combination_targets(hashtag_list):
+    """Lower-case each target once, paired with its '#tag' form"""
+    return tuple((tag.lower(), f"#{tag.lower()}") for tag in hashtag_list)
+
+def _has_all_hashtags(video, targets, match_plain_words=False) -> bool:
+    """True when the video carries every target from _combination_targets"""
+    video_hashtags = {h.lower() for h in getattr(video, 'hashtags', None) or ()}
+    description = (video.description or '').lower()
+    for tag, hash_tag in targets:
+        if tag in video_hashtags or hash_tag in description or (match_plain_words and tag in description):
+            continue
+        return False
+    return True
+
 async def _scrape_hashtag_combinations(analyzer, hashtag_list, limit, hashtags_str, start_date, end_date):
     """Scrape videos that contain ALL hashtags (combination mode)"""
     
@@ -170,70 +374,30 @@ async def _scrape_hashtag_combinations(analyzer, hashtag_list, limit, hashtags_s
     
     # For combination mode, we'll scrape more from each hashtag and filter
     scrape_limit = limit * 3  # Scrape 3x more to find combinations
+    targets = _combination_targets(hashtag_list)
     
-    # Scrape recent videos with combinations
-    print("📥 Scraping recent videos (looking for combinations)...")
-    recent_combo_videos = []
+    # One scrape covers both periods; each video is assigned to a period by its upload date
+    print(f"📥 Scraping videos (looking for combinations), split into recent and {start_date} to {end_date}...")
+    status = "   🔍 Searching #{} (looking for videos with all hashtags)..."
+    results = await _scrape_all_hashtags(analyzer, hashtag_list, scrape_limit, status)
     
-    for hashtag in hashtag_list:
-        print(f"   🔍 Searching #{hashtag} (looking for videos with all hashtags)...")
-        videos = await analyzer.scrape_hashtag_videos(hashtag, scrape_limit)
-        
-        # Filter videos that contain ALL hashtags
+    combo_videos = []
+    seen_ids = set()
+    for videos in results:
+        # Filter videos that contain ALL hashtags (the same video shows up under each tag)
         for video in videos:
-            video_hashtags = [h.lower() for h in video.hashtags] if hasattr(video, 'hashtags') else []
-            video_description = (video.description or '').lower()
-            
-            # Check if video contains ALL target hashtags
-            has_all_hashtags = True
-            for target_hashtag in hashtag_list:
-                target_lower = target_hashtag.lower()
-                if not (target_lower in video_hashtags or f"#{target_lower}" in video_description):
-                    has_all_hashtags = False
-                    break
-            
-            if has_all_hashtags and len(recent_combo_videos) < limit:
-                recent_combo_videos.append(video)
-                print(f"      ✅ Found combo video: @{video.creator_username} (has all hashtags)")
-    
-    # Store recent combination videos
-    for video in recent_combo_videos:
-        await _store_simple_video(video, 'recent', hashtags_str)
-        all_videos.append(video)
-    
-    print(f"📊 Found {len(recent_combo_videos)} recent videos with ALL hashtags")
-    
-    # Scrape past videos with combinations
-    print(f"📥 Scraping past videos ({start_date} to {end_date}, looking for combinations)...")
-    past_combo_videos = []
-    
-    for hashtag in hashtag_list:
-        print(f"   🔍 Searching #{hashtag} (looking for videos with all hashtags)...")
-        videos = await analyzer.scrape_hashtag_videos(hashtag, scrape_limit)
+            if video.video_id in seen_ids or not _has_all_hashtags(video, targets):
+                continue
+            seen_ids.add(video.video_id)
+            combo_videos.append(video)
+            logger.debug("      ✅ Found combo video: @%s (has all hashtags)", video.creator_username)
+    
+    for time_window, window_videos in zip(('recent', 'past'), _split_time_windows(combo_videos, start_date, end_date)):
+        window_videos = window_videos[:limit]
+        await _store_videos_bulk(window_videos, time_window, hashtags_str)
+        all_videos.extend(window_videos)
         
-        # Filter videos that contain ALL hashtags
-        for video in videos:
-            video_hashtags = [h.lower() for h in video.hashtags] if hasattr(video, 'hashtags') else []
-            video_description = (video.description or '').lower()
-            
-            # Check if video contains ALL target hashtags
-            has_all_hashtags = True
-            for target_hashtag in hashtag_list:
-                target_lower = target_hashtag.lower()
-                if not (target_lower in video_hashtags or f"#{target_lower}" in video_description):
-                    has_all_hashtags = False
-                    break
-            
-            if has_all_hashtags and len(past_combo_videos) < limit:
-                past_combo_videos.append(video)
-                print(f"      ✅ Found combo video: @{video.creator_username} (has all hashtags)")
-    
-    # Store past combination videos
-    for video in past_combo_videos:
-        await _store_simple_video(video, 'past', hashtags_str)
-        all_videos.append(video)
-    
-    print(f"📊 Found {len(past_combo_videos)} past videos with ALL hashtags")
+        print(f"📊 Found {len(window_videos)} {time_window} videos with ALL hashtags")
     
     return all_videos
 
@@ -245,23 +409,14 @@ async def _scrape_hashtags_separately(analyzer, hashtag_list, limit, hashtags_st
     
     all_videos = []
     
-    # Scrape recent videos
-    print("📥 Scraping recent videos (last 3 days)...")
-    for hashtag in hashtag_list:
-        print(f"   🔍 Scraping #{hashtag}...")
-        videos = await analyzer.scrape_hashtag_videos(hashtag, limit)
-        for video in videos:
-            await _store_simple_video(video, 'recent', hashtags_str)
-            all_videos.append(video)
-    
-    # Scrape past videos
-    print(f"📥 Scraping past videos ({start_date} to {end_date})...")
-    for hashtag in hashtag_list:
-        print(f"   🔍 Scraping #{hashtag}...")
-        videos = await analyzer.scrape_hashtag_videos(hashtag, limit)
-        for video in videos:
-            await _store_simple_video(video, 'past', hashtags_str)
-            all_videos.append(video)
+    # One scrape covers both periods; each video is assigned to a period by its upload date
+    print(f"📥 Scraping videos, split into recent (last {RECENT_WINDOW_DAYS} days) and {start_date} to {end_date}...")
+    for videos in await _scrape_all_hashtags(analyzer, hashtag_list, limit):
+        recent, past = _split_time_windows(videos, start_date, end_date)
+        await _store_videos_bulk(recent, 'recent', hashtags_str)
+        await _store_videos_bulk(past, 'past', hashtags_str)
+        all_videos.extend(recent)
+        all_videos.extend(past)
     
     return all_videos
 
@@ -273,8 +428,7 @@ async def analyze_transcripts():
     print("🔍 Reading ALL stored video descriptions/transcripts...")
     
     # Get all stored videos with descriptions
-    conn = sqlite3.connect('zoro_analysis.db')
-    cursor = conn.cursor()
+    cursor = _get_db().cursor()
     
     # Get recent videos with ACTUAL TRANSCRIPTS
     cursor.execute('''
@@ -296,7 +450,6 @@ async def analyze_transcripts():
     ''')
     
     all_videos = cursor.fetchall()
-    conn.close()
     
     if not all_videos:
         print("❌ No video descriptions found. Run option 1 to scrape videos first.")
@@ -336,8 +489,7 @@ async def analyze_transcripts():
         print("❌ No transcripts to analyze")
         return
     
-    from pipeline.llm_analyzer import LLMAnalyzer
-    llm_analyzer = LLMAnalyzer()
+    llm_analyzer = _llm_analyzer()
     
     # Call Claude to analyze ALL transcripts (detailed logging inside LLMAnalyzer)
     analysis_result = await llm_analyzer.analyze_emerging_topics(
@@ -345,23 +497,7 @@ async def analyze_transcripts():
     )
     
     # Display results focused on transcript content
-    print(f"\n🔥 WHAT PEOPLE ARE SAYING IN VIDEOS")
-    print("=" * 50)
-    
-    if analysis_result.get('emerging_topics'):
-        print("📈 EMERGING TOPICS:")
-        for i, topic in enumerate(analysis_result['emerging_topics'], 1):
-            print(f"   {i}. {topic}")
-    
-    if analysis_result.get('language_patterns'):
-        print("\n🗣️ LANGUAGE PATTERNS:")
-        for i, pattern in enumerate(analysis_result['language_patterns'], 1):
-            print(f"   {i}. {pattern}")
-    
-    if analysis_result.get('content_shifts'):
-        print("\n📝 CONTENT EVOLUTION:")
-        for i, shift in enumerate(analysis_result['content_shifts'], 1):
-            print(f"   {i}. {shift}")
+    _write_analysis_sections("🔥 WHAT PEOPLE ARE SAYING IN VIDEOS", 50, analysis_result)
     
     # Save detailed results
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -375,8 +511,7 @@ async def analyze_transcripts():
         'timestamp': timestamp
     }
     
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    _write_json(output_file, results)
     
     print(f"\n💾 Full analysis saved to: {output_file}")
     print("✅ TRANSCRIPT ANALYSIS COMPLETE!")
@@ -387,8 +522,7 @@ def show_data_summary():
     print("\n📊 DATABASE SUMMARY")
     print("=" * 30)
     
-    conn = sqlite3.connect('zoro_analysis.db')
-    cursor = conn.cursor()
+    cursor = _get_db().cursor()
     
     # Total videos
     cursor.execute("SELECT COUNT(*) FROM videos")
@@ -402,12 +536,8 @@ def show_data_summary():
     cursor.execute("SELECT COUNT(*) FROM videos WHERE description IS NOT NULL AND description != ''")
     with_descriptions = cursor.fetchone()[0]
     
-    print(f"📹 Total videos: {total}")
-    print(f"📝 With descriptions: {with_descriptions}")
-    print("\n📅 By time window:")
-    for window, count in by_window:
-        window_name = window if window else "unspecified"
-        print(f"   {window_name}: {count}")
+    lines = [f"📹 Total videos: {total}", f"📝 With descriptions: {with_descriptions}", "\n📅 By time window:"]
+    lines.extend(f"   {window or 'unspecified'}: {count}" for window, count in by_window)
     
     # Sample recent descriptions
     cursor.execute('''
@@ -418,64 +548,71 @@ def show_data_summary():
     
     recent_samples = cursor.fetchall()
     if recent_samples:
-        print("\n📄 Sample recent descriptions:")
-        for author, desc in recent_samples:
-            print(f"   @{author}: {desc[:80]}...")
-    
-    conn.close()
+        lines.append("\n📄 Sample recent descriptions:")
+        lines.extend(f"   @{author}: {desc[:80]}..." for author, desc in recent_samples)
+    
+    _emit("\n".join(lines) + "\n")
+
+def _video_row(video, time_window: str, hashtags: str, scraped_at: str) -> tuple:
+    """Build the videos-table row for one scraped video"""
+    hashtags_json = _dumps(video.hashtags) if hasattr(video, 'hashtags') else '[]'
+    engagement_rate = ((video.likes + video.comments + video.shares) / max(video.views, 1)) * 100
+    
+    return (
+        video.video_id,
+        video.creator_username,
+        video.description,
+        video.views,
+        video.likes,
+        video.comments,
+        video.shares,
+        engagement_rate,
+        hashtags_json,
+        time_window,
+        hashtags,
+        scraped_at
+    )
 
-async def _store_simple_video(video, time_window: str, hashtags: str):
-    """Store video in database with time window"""
-    conn = sqlite3.connect('zoro_analysis.db')
-    cursor = conn.cursor()
-    
-    # Create table if needed
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS videos (
-            video_id TEXT PRIMARY KEY,
-            author TEXT,
-            description TEXT,
-            views INTEGER,
-            likes INTEGER,
-            comments INTEGER,
-            shares INTEGER,
-            engagement_rate REAL,
-            hashtags TEXT,
-            time_window TEXT,
-            analyzed_hashtags TEXT,
-            scraped_at TEXT
-        )
-    ''')
+# Serializes BEGIN/COMMIT on the shared connection across worker threads
+_DB_WRITE_LOCK = threading.Lock()
+
+def _write_videos(videos, time_window: str, hashtags: str):
+    """Insert a batch of videos in one transaction, falling back to row-by-row inserts if it fails (blocking)"""
+    # One scrape timestamp for the whole batch
+    scraped_at = datetime.now().isoformat()
+    rows = []
+    for video in videos:
+        try:
+            rows.append(_video_row(video, time_window, hashtags, scraped_at))
+        except Exception as e:
+            print(f"   ❌ Skipping video {getattr(video, 'video_id', '?')}: {e}")
+    if not rows:
+        return
     
-    try:
-        hashtags_json = json.dumps(video.hashtags) if hasattr(video, 'hashtags') else '[]'
-        engagement_rate = ((video.likes + video.comments + video.shares) / max(video.views, 1)) * 100
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO videos (
-                video_id, author, description, views, likes, comments, shares,
-                engagement_rate, hashtags, time_window, analyzed_hashtags, scraped_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            video.video_id,
-            video.creator_username,
-            video.description,
-            video.views,
-            video.likes,
-            video.comments,
-            video.shares,
-            engagement_rate,
-            hashtags_json,
-            time_window,
-            hashtags,
-            datetime.now().isoformat()
-        ))
+    conn = _get_db()
+    with _DB_WRITE_LOCK:
+        try:
+            conn.execute("BEGIN")
+            conn.executemany(_INSERT_VIDEO_SQL, rows)
+            conn.execute("COMMIT")
+            return
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            print(f"   ⚠️ Batch insert failed ({e}), storing videos one by one")
         
-        conn.commit()
-    except Exception as e:
-        print(f"   ❌ Error storing video: {e}")
-    finally:
-        conn.close()
+        # Autocommit connection: each good row is kept even if another one fails
+        for row in rows:
+            try:
+                conn.execute(_INSERT_VIDEO_SQL, row)
+            except sqlite3.Error as e:
+                print(f"   ❌ Error storing video {row[0]}: {e}")
+
+async def _store_videos_bulk(videos, time_window: str, hashtags: str):
+    """Store a batch of videos in one transaction without blocking the event loop"""
+    if not videos:
+        return
+    await asyncio.to_thread(_write_videos, videos, time_window, hashtags)
 
 # ==================================================
 # MAIN COMMAND CENTER
@@ -501,38 +638,30 @@ async def main():
     print("✅ TikTok Scraping: Ready")
     print()
     
-    print("🎯 CHOOSE ANALYSIS TYPE:")
-    print("1. Single Video Analysis")
-    print("2. Creator Analysis") 
-    print("3. Emerging Topics Analysis (Hashtag Workflow)")
-    print("4. 🔥 Hashtag Combination Analysis (NEW)")
-    print()
+    print(_MAIN_MENU)
     
     choice = input("Enter choice (1/2/3/4): ").strip()
     
-    if choice == "1":
-        await single_video_analysis()
-    elif choice == "2":
-        await creator_analysis()
-    elif choice == "3":
-        await emerging_topics_analysis()
-    elif choice == "4":
-        await hashtag_combination_analysis()
-    else:
-        print("❌ Invalid choice. Please run again.")
+    try:
+        if choice == "1":
+            await single_video_analysis()
+        elif choice == "2":
+            await creator_analysis()
+        elif choice == "3":
+            await emerging_topics_analysis()
+        elif choice == "4":
+            await hashtag_combination_analysis()
+        else:
+            print("❌ Invalid choice. Please run again.")
+    finally:
+        # Entry-point shutdown of the process-wide Claude client
+        from ai.claude_primary_system import shutdown_ai_system
+        await shutdown_ai_system()
 
 async def hashtag_combination_analysis():
     """🔥 NEW: Streamlined hashtag combination analysis"""
     
-    print("\n🔥 HASHTAG COMBINATION ANALYSIS")
-    print("=" * 50)
-    print("📋 This will:")
-    print("   1. Find videos with ALL your hashtags (combination)")
-    print("   2. Scrape 50 recent videos (last 3 days)")
-    print("   3. Scrape 50 past videos (your chosen date)")
-    print("   4. Store all 100 videos")
-    print("   5. LLM reads ALL transcripts to find emerging topics")
-    print()
+    print(_COMBINATION_INTRO)
     
     # Get hashtag combination
     hashtags = input("Enter hashtag combination (e.g., '#startup,#tech,#ai'): ").strip()
@@ -567,27 +696,21 @@ async def hashtag_combination_analysis():
         print("❌ Analysis cancelled")
         return
     
-    from standard_video_analyzer import StandardVideoAnalyzer
-    analyzer = StandardVideoAnalyzer()
+    analyzer = _video_analyzer()
     hashtag_list = [tag.strip().replace('#', '') for tag in hashtags.split(',')]
     
-    # Step 1: Scrape recent videos with ALL hashtags
-    print(f"\n🔍 STEP 1: RECENT VIDEOS")
+    # Steps 1 + 2: One scrape for videos with ALL hashtags, split into the two periods by upload date
+    print(f"\n🔍 STEPS 1-2: RECENT + PAST VIDEOS")
     print("=" * 30)
-    print("🔍 Looking for videos with ALL hashtags in recent 3 days...")
+    print(f"🔍 Looking for videos with ALL hashtags in recent {RECENT_WINDOW_DAYS} days and from {past_period}...")
     
-    recent_videos = await _scrape_combination_videos(
-        analyzer, hashtag_list, 50, "recent", hashtags
-    )
-    
-    # Step 2: Scrape past videos with ALL hashtags  
-    print(f"\n🔍 STEP 2: PAST VIDEOS")
-    print("=" * 30)
-    print(f"🔍 Looking for videos with ALL hashtags from {past_period}...")
+    combo_videos = await _scrape_combination_videos(analyzer, hashtag_list, 100)
+    recent_videos, past_videos = _split_time_windows(combo_videos, start_date, end_date)
+    recent_videos, past_videos = recent_videos[:50], past_videos[:50]
     
-    past_videos = await _scrape_combination_videos(
-        analyzer, hashtag_list, 50, "past", hashtags
-    )
+    # A video belongs to one period only, so the two writes never touch the same row
+    await _store_videos_bulk(recent_videos, "recent", hashtags)
+    await _store_videos_bulk(past_videos, "past", hashtags)
     
     total_videos = len(recent_videos) + len(past_videos)
     print(f"\n✅ SCRAPING COMPLETE!")
@@ -604,8 +727,7 @@ async def hashtag_combination_analysis():
     print("=" * 40)
     
     # Get stored videos for analysis
-    conn = sqlite3.connect('zoro_analysis.db')
-    cursor = conn.cursor()
+    cursor = _get_db().cursor()
     
     # Get videos with ACTUAL TRANSCRIPTS prioritized
     cursor.execute('''
@@ -628,7 +750,6 @@ async def hashtag_combination_analysis():
     ''', (hashtags,))
     
     all_videos = cursor.fetchall()
-    conn.close()
     
     if not all_videos:
         print("❌ No transcript data found. Try scraping again.")
@@ -667,8 +788,7 @@ async def hashtag_combination_analysis():
     print(f"      📝 {len(past_transcripts) - past_real} with descriptions")
     
     # Run LLM Analysis
-    from pipeline.llm_analyzer import LLMAnalyzer
-    llm_analyzer = LLMAnalyzer()
+    llm_analyzer = _llm_analyzer()
     
     print(f"\n🤖 Running Claude analysis on {len(recent_transcripts + past_transcripts)} transcripts...")
     
@@ -677,23 +797,7 @@ async def hashtag_combination_analysis():
     )
     
     # Display results
-    print(f"\n🔥 EMERGING TOPICS FROM HASHTAG COMBINATION: {hashtags}")
-    print("=" * 60)
-    
-    if analysis_result.get('emerging_topics'):
-        print("📈 EMERGING TOPICS:")
-        for i, topic in enumerate(analysis_result['emerging_topics'], 1):
-            print(f"   {i}. {topic}")
-    
-    if analysis_result.get('language_patterns'):
-        print("\n🗣️ LANGUAGE PATTERNS:")
-        for i, pattern in enumerate(analysis_result['language_patterns'], 1):
-            print(f"   {i}. {pattern}")
-    
-    if analysis_result.get('content_shifts'):
-        print("\n📝 CONTENT EVOLUTION:")
-        for i, shift in enumerate(analysis_result['content_shifts'], 1):
-            print(f"   {i}. {shift}")
+    _write_analysis_sections(f"🔥 EMERGING TOPICS FROM HASHTAG COMBINATION: {hashtags}", 60, analysis_result)
     
     # Save detailed results
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -714,8 +818,7 @@ async def hashtag_combination_analysis():
         'timestamp': timestamp
     }
     
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    _write_json(output_file, results)
     
     print(f"\n💾 Full analysis saved to: {output_file}")
     print("✅ HASHTAG COMBINATION ANALYSIS COMPLETE!")
@@ -729,8 +832,8 @@ async def hashtag_combination_analysis():
     
     await interactive_chat_mode(recent_transcripts, past_transcripts, hashtag_list, analysis_result)
 
-async def _scrape_combination_videos(analyzer, hashtag_list, limit, time_window, hashtags_str):
-    """Scrape videos that contain ALL hashtags in the combination"""
+async def _scrape_combination_videos(analyzer, hashtag_list, limit):
+    """Scrape videos that contain ALL hashtags in the combination (the caller stores them)"""
     
     found_videos = []
     scrape_limit = limit * 4  # Scrape more to find enough combinations
@@ -742,30 +845,16 @@ async def _scrape_combination_videos(analyzer, hashtag_list, limit, time_window,
     videos = await analyzer.scrape_hashtag_videos(primary_hashtag, scrape_limit)
     
     # Filter videos that contain ALL hashtags
+    targets = _combination_targets(hashtag_list)
+    seen_ids = set()
     for video in videos:
         if len(found_videos) >= limit:
             break
-            
-        video_hashtags = [h.lower() for h in video.hashtags] if hasattr(video, 'hashtags') else []
-        video_description = (video.description or '').lower()
         
-        # Check if video contains ALL target hashtags
-        has_all_hashtags = True
-        for target_hashtag in hashtag_list:
-            target_lower = target_hashtag.lower()
-            hashtag_found = (
-                target_lower in video_hashtags or 
-                f"#{target_lower}" in video_description or
-                target_lower in video_description
-            )
-            if not hashtag_found:
-                has_all_hashtags = False
-                break
-        
-        if has_all_hashtags:
+        if video.video_id not in seen_ids and _has_all_hashtags(video, targets, match_plain_words=True):
+            seen_ids.add(video.video_id)
             found_videos.append(video)
-            await _store_simple_video(video, time_window, hashtags_str)
-            print(f"      ✅ Found: @{video.creator_username} (has all hashtags)")
+            logger.debug("      ✅ Found: @%s (has all hashtags)", video.creator_username)
     
     print(f"   📊 Found {len(found_videos)} videos with ALL hashtags")
     return found_videos
@@ -773,8 +862,7 @@ async def _scrape_combination_videos(analyzer, hashtag_list, limit, time_window,
 async def interactive_chat_mode(recent_transcripts, past_transcripts, hashtags, previous_analysis):
     """Interactive chat with Claude about the scraped data"""
     
-    from pipeline.llm_analyzer import LLMAnalyzer
-    llm_analyzer = LLMAnalyzer()
+    llm_analyzer = _llm_analyzer()
     
     # Prepare context for Claude
     context_summary = {
@@ -855,4 +943,11 @@ Please provide a detailed, actionable answer based on the transcript data above.
             break
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # `python quick_commands.py status` prints the DB summary without the env, Claude check or event loop
+    if sys.argv[1:] == ["status"]:
+        show_data_summary()
+        sys.exit(0)
+    
+    # Per-video progress is logged at DEBUG; set ZORO_LOG_LEVEL=DEBUG to see it
+    logging.basicConfig(level=os.getenv("ZORO_LOG_LEVEL", "INFO").upper(), format="%(message)s")
+    (uvloop.run if UVLOOP_AVAILABLE else asyncio.run)(main()) 
\ No newline at end of file
@@ -7,6 +7,7 @@ Minimal video analysis functions for the pipeline.
 """
 
 import asyncio
+import logging
 import sys
 import os
 import json
@@ -17,6 +18,8 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from load_env import load_env_file
 from agents.apify_ingestion_agent import ApifyTikTokIngestion
 
+logger = logging.getLogger("zoro.analyzer")
+
 class StandardVideoAnalyzer:
     """Standard video analyzer for pipeline integration"""
     
@@ -101,7 +104,7 @@ class StandardVideoAnalyzer:
             ))
             
             conn.commit()
-            print(f"   💾 Stored video {video.video_id} in database")
+            logger.debug("   💾 Stored video %s in database", video.video_id)
             
         except Exception as e:
             print(f"   ❌ Error storing video: {e}")